@@ -1,97 +1,251 @@
+import functools
 import os
 import re
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from collections import namedtuple
+from urllib.parse import urlsplit
+from typing import Dict, Any, Optional, Tuple
+from dotenv import find_dotenv, load_dotenv
 import logging
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
+_DOTENV_LOADED = False
+
+_AFFILIATE_ID_RE = re.compile(r'^[a-zA-Z0-9\-]{10,20}\Z')
+_ASIN_RE = re.compile(r'/(?:dp|gp/product)/([A-Z0-9]{10})')
+
+
+class _PriceCharTable(dict):
+    # str.translate table that keeps digits, '.' and ',' and deletes everything
+    # else; unseen characters are resolved once and then served from the dict
+    
+    def __missing__(self, key):
+        self[key] = None
+        return None
+
+
+_PRICE_KEEP_TABLE = _PriceCharTable((ord(ch), ord(ch)) for ch in '0123456789.,')
+
+
+def _ensure_dotenv() -> None:
+    
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    # Containerized runs inject env directly; skip the file read when there is no .env
+    dotenv_path = find_dotenv()
+    if dotenv_path:
+        load_dotenv(dotenv_path)
+    _DOTENV_LOADED = True
+
+
+CurrencyInfo = namedtuple('CurrencyInfo', 'symbol code domain')
+
+_DOMAIN_LOOKUP = {
+    'amazon.co.uk': 'amazon.co.uk',
+    'amazon.de': 'amazon.de',
+    'amazon.fr': 'amazon.fr',
+    'amazon.ca': 'amazon.ca',
+    'amazon.com.au': 'amazon.com.au',
+    'amazon.co.jp': 'amazon.co.jp',
+    'amazon.in': 'amazon.in',
+}
+
+_LINK_TEMPLATES = {
+    domain: f"https://{domain}/dp/{{asin}}?tag={{tag}}&linkCode=as2&camp=1789&creative=9325"
+    for domain in (*_DOMAIN_LOOKUP.values(), 'www.amazon.com')
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_product_url(product_url: str) -> Tuple[str, Optional[str]]:
+    
+    asin_match = _ASIN_RE.search(product_url)
+    if not asin_match:
+        return 'www.amazon.com', None
+    
+    # Key on the registrable amazon.<tld> so www., smile. and m. links keep their marketplace
+    _, sep, tld = ('.' + (urlsplit(product_url).hostname or '')).rpartition('.amazon.')
+    marketplace = 'amazon.' + tld if sep else ''
+    return _DOMAIN_LOOKUP.get(marketplace, 'www.amazon.com'), asin_match.group(1)
+
+
+# Pure for a given (url, tag) pair, so repeated links are served from the cache
+@functools.lru_cache(maxsize=4096)
+def _build_affiliate_link(product_url: str, affiliate_id: str) -> str:
+    
+    try:
+        domain, asin = _parse_product_url(product_url)
+        
+        if asin:
+            return _LINK_TEMPLATES[domain].format(asin=asin, tag=affiliate_id)
+        
+        separator = '&' if '?' in product_url else '?'
+        return f"{product_url}{separator}tag={affiliate_id}&linkCode=as2&camp=1789&creative=9325"
+        
+    except Exception as e:
+        logger.error("Error generating affiliate link: %s", e)
+        separator = '&' if '?' in product_url else '?'
+        return f"{product_url}{separator}tag={affiliate_id}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_price(price: str, region: str, symbol: str) -> str:
+    
+    try:
+        numeric_price = price.translate(_PRICE_KEEP_TABLE)
+        
+        if ',' in numeric_price and '.' in numeric_price:
+            numeric_price = numeric_price.replace(',', '')
+        elif ',' in numeric_price and region in ['DE', 'FR']:
+            numeric_price = numeric_price.replace(',', '.')
+        
+        price_value = float(numeric_price)
+        
+        if region == 'JP':
+            return f"{symbol}{int(price_value):,}"
+        else:
+            return f"{symbol}{price_value:,.2f}"
+            
+    except (ValueError, TypeError, AttributeError):
+        return f"{symbol}{price}"
+
 
 class Config:
     
+    __slots__ = (
+        'BOT_TOKEN', 'OPENAI_API_KEY', 'DATABASE_URL', 'AMAZON_AFFILIATE_ID',
+        'TELEGRAM_CHANNEL', 'MAX_DEALS_PER_SOURCE', 'POST_INTERVAL_MINUTES',
+        'REQUEST_TIMEOUT', 'RATE_LIMIT_DELAY', 'FLASK_HOST', 'FLASK_PORT',
+        'FLASK_SECRET_KEY', 'REGIONAL_AFFILIATE_IDS', 'REGIONAL_CURRENCIES',
+        'DEFAULT_REGION', 'ADMIN_USER_IDS', '_SUPPORTED_REGIONS', '_REGION_INFO_CACHE',
+        '_valid_affiliate_ids', '_bot_configured', '_openai_configured', '_database_configured',
+        '_dict_snapshot',
+    )
     
     def __init__(self):
         
-        self.BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', os.getenv('BOT_TOKEN', ''))
-        self.OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
-        self.DATABASE_URL = os.getenv('DATABASE_URL', '')
+        _ensure_dotenv()
+        env = dict(os.environ)
+        
+        self.BOT_TOKEN = env.get('TELEGRAM_BOT_TOKEN') or env.get('BOT_TOKEN', '')
+        self.OPENAI_API_KEY = env.get('OPENAI_API_KEY', '')
+        self.DATABASE_URL = env.get('DATABASE_URL', '')
+        
+        self._bot_configured = bool(self.BOT_TOKEN)
+        self._openai_configured = bool(self.OPENAI_API_KEY)
+        self._database_configured = bool(self.DATABASE_URL and self.DATABASE_URL.startswith('postgresql'))
         
         # Use only AMAZON_AFFILIATE_ID - no fallback to AFFILIATE_ID
-        amazon_affiliate_id = os.getenv('AMAZON_AFFILIATE_ID', '').strip()
+        amazon_affiliate_id = env.get('AMAZON_AFFILIATE_ID', '').strip()
         if not amazon_affiliate_id:
             logger.warning("⚠️ AMAZON_AFFILIATE_ID not configured - affiliate links will not work properly")
         # Validate affiliate ID format (alphanumeric + hyphens, typically 10-15 chars)
-        if amazon_affiliate_id and not re.match(r'^[a-zA-Z0-9\-]{10,20}$', amazon_affiliate_id):
-            logger.warning(f"⚠️ AMAZON_AFFILIATE_ID format may be invalid: {amazon_affiliate_id[:10]}...")
+        if amazon_affiliate_id and not _AFFILIATE_ID_RE.match(amazon_affiliate_id):
+            logger.warning("⚠️ AMAZON_AFFILIATE_ID format may be invalid: %s...", amazon_affiliate_id[:10])
         self.AMAZON_AFFILIATE_ID = amazon_affiliate_id
         
         # Fix typo: TELEGRAM_CHENNAL -> TELEGRAM_CHANNEL (keep fallback for backward compatibility)
-        self.TELEGRAM_CHANNEL = os.getenv('TELEGRAM_CHANNEL', os.getenv('TELEGRAM_CHENNAL', ''))
+        self.TELEGRAM_CHANNEL = env.get('TELEGRAM_CHANNEL') or env.get('TELEGRAM_CHENNAL', '')
         
-        self.MAX_DEALS_PER_SOURCE = int(os.getenv('MAX_DEALS_PER_SOURCE', '5'))
-        self.POST_INTERVAL_MINUTES = int(os.getenv('POST_INTERVAL_MINUTES', '6'))
-        self.REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
-        self.RATE_LIMIT_DELAY = int(os.getenv('RATE_LIMIT_DELAY', '2'))
+        self.MAX_DEALS_PER_SOURCE = int(env.get('MAX_DEALS_PER_SOURCE', '5'))
+        self.POST_INTERVAL_MINUTES = int(env.get('POST_INTERVAL_MINUTES', '6'))
+        self.REQUEST_TIMEOUT = int(env.get('REQUEST_TIMEOUT', '30'))
+        self.RATE_LIMIT_DELAY = int(env.get('RATE_LIMIT_DELAY', '2'))
         
-        self.FLASK_HOST = os.getenv('FLASK_HOST', '0.0.0.0')
-        self.FLASK_PORT = int(os.getenv('FLASK_PORT', '5000'))
-        self.FLASK_SECRET_KEY = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
+        self.FLASK_HOST = env.get('FLASK_HOST', '0.0.0.0')
+        self.FLASK_PORT = int(env.get('FLASK_PORT', '5000'))
+        self.FLASK_SECRET_KEY = env.get('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
         
         self.REGIONAL_AFFILIATE_IDS = {
             'US': self.AMAZON_AFFILIATE_ID,
-            'UK': os.getenv('AMAZON_AFFILIATE_ID_UK', self.AMAZON_AFFILIATE_ID),
-            'DE': os.getenv('AMAZON_AFFILIATE_ID_DE', self.AMAZON_AFFILIATE_ID),
-            'FR': os.getenv('AMAZON_AFFILIATE_ID_FR', self.AMAZON_AFFILIATE_ID),
-            'CA': os.getenv('AMAZON_AFFILIATE_ID_CA', self.AMAZON_AFFILIATE_ID),
-            'JP': os.getenv('AMAZON_AFFILIATE_ID_JP', self.AMAZON_AFFILIATE_ID),
-            'AU': os.getenv('AMAZON_AFFILIATE_ID_AU', self.AMAZON_AFFILIATE_ID),
-            'IN': os.getenv('AMAZON_AFFILIATE_ID_IN', self.AMAZON_AFFILIATE_ID),
+            'UK': env.get('AMAZON_AFFILIATE_ID_UK', self.AMAZON_AFFILIATE_ID),
+            'DE': env.get('AMAZON_AFFILIATE_ID_DE', self.AMAZON_AFFILIATE_ID),
+            'FR': env.get('AMAZON_AFFILIATE_ID_FR', self.AMAZON_AFFILIATE_ID),
+            'CA': env.get('AMAZON_AFFILIATE_ID_CA', self.AMAZON_AFFILIATE_ID),
+            'JP': env.get('AMAZON_AFFILIATE_ID_JP', self.AMAZON_AFFILIATE_ID),
+            'AU': env.get('AMAZON_AFFILIATE_ID_AU', self.AMAZON_AFFILIATE_ID),
+            'IN': env.get('AMAZON_AFFILIATE_ID_IN', self.AMAZON_AFFILIATE_ID),
         }
         
+        # Validate every regional ID once so get_affiliate_link only needs a set lookup
+        self._valid_affiliate_ids = frozenset(
+            aid for aid in self.REGIONAL_AFFILIATE_IDS.values() if aid and _AFFILIATE_ID_RE.match(aid)
+        )
+        for region, aid in self.REGIONAL_AFFILIATE_IDS.items():
+            if region != 'US' and aid and aid not in self._valid_affiliate_ids:
+                logger.warning("⚠️ AMAZON_AFFILIATE_ID_%s format may be invalid: %s...", region, aid[:10])
+        
         self.REGIONAL_CURRENCIES = {
-            'US': {'symbol': '$', 'code': 'USD', 'domain': 'amazon.com'},
-            'UK': {'symbol': '£', 'code': 'GBP', 'domain': 'amazon.co.uk'},
-            'DE': {'symbol': '€', 'code': 'EUR', 'domain': 'amazon.de'},
-            'FR': {'symbol': '€', 'code': 'EUR', 'domain': 'amazon.fr'},
-            'CA': {'symbol': 'C$', 'code': 'CAD', 'domain': 'amazon.ca'},
-            'JP': {'symbol': '¥', 'code': 'JPY', 'domain': 'amazon.co.jp'},
-            'AU': {'symbol': 'A$', 'code': 'AUD', 'domain': 'amazon.com.au'},
-            'IN': {'symbol': '₹', 'code': 'INR', 'domain': 'amazon.in'},
+            'US': CurrencyInfo('$', 'USD', 'amazon.com'),
+            'UK': CurrencyInfo('£', 'GBP', 'amazon.co.uk'),
+            'DE': CurrencyInfo('€', 'EUR', 'amazon.de'),
+            'FR': CurrencyInfo('€', 'EUR', 'amazon.fr'),
+            'CA': CurrencyInfo('C$', 'CAD', 'amazon.ca'),
+            'JP': CurrencyInfo('¥', 'JPY', 'amazon.co.jp'),
+            'AU': CurrencyInfo('A$', 'AUD', 'amazon.com.au'),
+            'IN': CurrencyInfo('₹', 'INR', 'amazon.in'),
         }
         
-        self.DEFAULT_REGION = os.getenv('DEFAULT_REGION', 'US')
+        self._SUPPORTED_REGIONS = tuple(self.REGIONAL_CURRENCIES.keys())
         
-        admin_ids_str = os.getenv('ADMIN_USER_IDS', '')
-        self.ADMIN_USER_IDS = [int(uid.strip()) for uid in admin_ids_str.split(',') if uid.strip().isdigit()] if admin_ids_str else []
+        self.DEFAULT_REGION = env.get('DEFAULT_REGION', 'US')
         
-        self._log_configuration()
+        # Region info is fixed after init, so build every entry up front
+        self._REGION_INFO_CACHE = {
+            region: {
+                'region': region,
+                'currency_symbol': currency_info.symbol,
+                'currency_code': currency_info.code,
+                'amazon_domain': currency_info.domain,
+                'affiliate_id': self.REGIONAL_AFFILIATE_IDS.get(region, self.AMAZON_AFFILIATE_ID)
+            }
+            for region, currency_info in self.REGIONAL_CURRENCIES.items()
+        }
+        
+        admin_ids_str = env.get('ADMIN_USER_IDS', '')
+        self.ADMIN_USER_IDS = [int(uid) for uid in map(str.strip, admin_ids_str.split(',')) if uid.isdigit()] if admin_ids_str else []
+        
+        # Config is immutable after construction, so the summary is built once
+        self._dict_snapshot = {
+            'bot_configured': self.bot_configured,
+            'openai_configured': self.openai_configured,
+            'database_configured': self.database_configured,
+            'amazon_affiliate_id': self.AMAZON_AFFILIATE_ID,
+            'telegram_channel': self.TELEGRAM_CHANNEL,
+            'default_region': self.DEFAULT_REGION,
+            'max_deals_per_source': self.MAX_DEALS_PER_SOURCE,
+            'post_interval_minutes': self.POST_INTERVAL_MINUTES,
+            'supported_regions': self._SUPPORTED_REGIONS
+        }
+        
+        if logger.isEnabledFor(logging.INFO):
+            self._log_configuration()
     
     def _log_configuration(self):
         
         logger.info("📋 Configuration loaded:")
-        logger.info(f"  🤖 Bot configured: {self.bot_configured}")
-        logger.info(f"  🧠 OpenAI configured: {self.openai_configured}")
-        logger.info(f"  📊 Database configured: {self.database_configured}")
-        logger.info(f"  🛒 Amazon Affiliate ID: {self.AMAZON_AFFILIATE_ID or 'Not configured'}")
-        logger.info(f"  📢 Telegram channel: {self.TELEGRAM_CHANNEL or 'Not configured'}")
-        logger.info(f"  🌍 Default region: {self.DEFAULT_REGION}")
+        logger.info("  🤖 Bot configured: %s", self.bot_configured)
+        logger.info("  🧠 OpenAI configured: %s", self.openai_configured)
+        logger.info("  📊 Database configured: %s", self.database_configured)
+        logger.info("  🛒 Amazon Affiliate ID: %s", self.AMAZON_AFFILIATE_ID or 'Not configured')
+        logger.info("  📢 Telegram channel: %s", self.TELEGRAM_CHANNEL or 'Not configured')
+        logger.info("  🌍 Default region: %s", self.DEFAULT_REGION)
     
     @property
     def bot_configured(self) -> bool:
         
-        return bool(self.BOT_TOKEN)
+        return self._bot_configured
     
     @property
     def openai_configured(self) -> bool:
         
-        return bool(self.OPENAI_API_KEY)
+        return self._openai_configured
     
     @property
     def database_configured(self) -> bool:
         
-        return bool(self.DATABASE_URL and self.DATABASE_URL.startswith('postgresql'))
+        return self._database_configured
     
     @property
     def POST_INTERVAL_HOURS(self) -> float:
@@ -121,8 +275,8 @@ class Config:
             return ""
         
         # Validate URL format
-        if not (product_url.startswith('http://') or product_url.startswith('https://')):
-            logger.warning(f"Invalid URL format: {product_url[:50]}...")
+        if not product_url.startswith(('http://', 'https://')):
+            logger.warning("Invalid URL format: %s...", product_url[:50])
             return ""
         
         if not self.AMAZON_AFFILIATE_ID:
@@ -132,47 +286,14 @@ class Config:
         region = region or self.DEFAULT_REGION
         affiliate_id = self.REGIONAL_AFFILIATE_IDS.get(region, self.AMAZON_AFFILIATE_ID)
         
-        # Validate affiliate ID format
-        if affiliate_id and not re.match(r'^[a-zA-Z0-9\-]{10,20}$', affiliate_id):
-            logger.warning(f"Invalid affiliate ID format: {affiliate_id[:10]}...")
+        # Affiliate ID formats are checked once in __init__
+        if affiliate_id and affiliate_id not in self._valid_affiliate_ids:
+            logger.warning("Invalid affiliate ID format: %s...", affiliate_id[:10])
             return product_url
         
-        try:
-            asin_match = re.search(r'/dp/([A-Z0-9]{10})', product_url)
-            if not asin_match:
-                asin_match = re.search(r'/gp/product/([A-Z0-9]{10})', product_url)
-            
-            if asin_match:
-                asin = asin_match.group(1)
-                
-                if 'amazon.co.uk' in product_url:
-                    domain = 'amazon.co.uk'
-                elif 'amazon.de' in product_url:
-                    domain = 'amazon.de'
-                elif 'amazon.fr' in product_url:
-                    domain = 'amazon.fr'
-                elif 'amazon.ca' in product_url:
-                    domain = 'amazon.ca'
-                elif 'amazon.com.au' in product_url:
-                    domain = 'amazon.com.au'
-                elif 'amazon.co.jp' in product_url:
-                    domain = 'amazon.co.jp'
-                elif 'amazon.in' in product_url:
-                    domain = 'amazon.in'
-                else:
-                    domain = 'www.amazon.com'
-                
-                return f"https://{domain}/dp/{asin}?tag={affiliate_id}&linkCode=as2&camp=1789&creative=9325"
-            
-            separator = '&' if '?' in product_url else '?'
-            return f"{product_url}{separator}tag={affiliate_id}&linkCode=as2&camp=1789&creative=9325"
-            
-        except Exception as e:
-            logger.error(f"Error generating affiliate link: {e}")
-            separator = '&' if '?' in product_url else '?'
-            return f"{product_url}{separator}tag={affiliate_id}"
+        return _build_affiliate_link(product_url, affiliate_id)
     
-    def get_regional_currency(self, region: Optional[str] = None) -> Dict[str, str]:
+    def get_regional_currency(self, region: Optional[str] = None) -> CurrencyInfo:
         
         region = region or self.DEFAULT_REGION
         return self.REGIONAL_CURRENCIES.get(region, self.REGIONAL_CURRENCIES['US'])
@@ -181,56 +302,27 @@ class Config:
         
         region = region or self.DEFAULT_REGION
         currency_info = self.get_regional_currency(region)
-        
-        try:
-            numeric_price = re.sub(r'[^\d.,]', '', price)
-            
-            if ',' in numeric_price and '.' in numeric_price:
-                numeric_price = numeric_price.replace(',', '')
-            elif ',' in numeric_price and region in ['DE', 'FR']:
-                numeric_price = numeric_price.replace(',', '.')
-            
-            price_value = float(numeric_price)
-            
-            if region == 'JP':
-                return f"{currency_info['symbol']}{int(price_value):,}"
-            else:
-                return f"{currency_info['symbol']}{price_value:,.2f}"
-                
-        except (ValueError, TypeError):
-            return f"{currency_info['symbol']}{price}"
+        return _format_price(price, region, currency_info.symbol)
     
-    def get_supported_regions(self) -> list:
+    def get_supported_regions(self) -> tuple:
         
-        return list(self.REGIONAL_CURRENCIES.keys())
+        return self._SUPPORTED_REGIONS
     
     def get_region_info(self, region: Optional[str] = None) -> Dict[str, Any]:
         
         effective_region: str = region or self.DEFAULT_REGION
         
-        if effective_region not in self.REGIONAL_CURRENCIES:
+        if effective_region not in self._REGION_INFO_CACHE:
             effective_region = self.DEFAULT_REGION
         
-        currency_info = self.REGIONAL_CURRENCIES[effective_region]
-        
-        return {
-            'region': effective_region,
-            'currency_symbol': currency_info['symbol'],
-            'currency_code': currency_info['code'],
-            'amazon_domain': currency_info['domain'],
-            'affiliate_id': self.REGIONAL_AFFILIATE_IDS.get(effective_region, self.AMAZON_AFFILIATE_ID)
-        }
+        return self._REGION_INFO_CACHE[effective_region].copy()
     
     def to_dict(self) -> Dict[str, Any]:
         
-        return {
-            'bot_configured': self.bot_configured,
-            'openai_configured': self.openai_configured,
-            'database_configured': self.database_configured,
-            'amazon_affiliate_id': self.AMAZON_AFFILIATE_ID,
-            'telegram_channel': self.TELEGRAM_CHANNEL,
-            'default_region': self.DEFAULT_REGION,
-            'max_deals_per_source': self.MAX_DEALS_PER_SOURCE,
-            'post_interval_minutes': self.POST_INTERVAL_MINUTES,
-            'supported_regions': self.get_supported_regions()
-        }
+        return self._dict_snapshot.copy()
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    
+    return Config()
@@ -1,13 +1,96 @@
 import asyncio
 import aiohttp
 import logging
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+import random
+import re
+import sys
+from collections import Counter
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from urllib.parse import urlparse
+from aiohttp.abc import AbstractResolver
+from core.cache import SingleFlight, TTLCache
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# ASINs are matched case-insensitively and upper-cased for keys, the same rule _ASIN_FORMAT_RE applies
+_ASIN_RE = re.compile(r'/(?:dp|gp/product)/([A-Za-z0-9]{10})')
+_TAG_RE = re.compile(r'[?&]tag=([^&#]+)')
+_PRODUCT_SEGMENT_RE = re.compile(r'/(?:dp|gp/product)/([^/?#]*)')
+_ASIN_FORMAT_RE = re.compile(r'[A-Za-z0-9]{10}\Z')
+_AMAZON_DOMAINS = frozenset({
+    'amazon.com', 'amazon.co.uk', 'amazon.de', 'amazon.fr',
+    'amazon.it', 'amazon.es', 'amazon.ca', 'amazon.com.mx',
+    'amazon.com.br', 'amazon.in', 'amazon.co.jp', 'amazon.com.au'
+})
+
+_VALID_STATUSES = frozenset({200, 206, 301, 302, 416})
+_HEAD_REJECTED_STATUSES = frozenset({403, 405, 501})
+_RETRY_STATUSES = frozenset({429, 503})
+_DEFINITIVE_FAILURE_STATUSES = frozenset({404, 410})
+
+# Probe only the first KiB when HEAD is refused; ClientTimeout is immutable so one instance is shared
+_RANGE_HEADERS = {'Range': 'bytes=0-1023'}
+_FALLBACK_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 10.0
+
+# Shared across validator instances: a new LinkValidator is created per posting cycle
+_RESULT_CACHE = TTLCache(maxsize=10_000, ttl=600)
+
+
+def _build_resolver() -> AbstractResolver:
+    """Prefer the c-ares backed resolver; fall back to the thread-pool one without aiodns."""
+    if sys.platform != 'win32':
+        try:
+            return aiohttp.AsyncResolver()
+        except (ImportError, RuntimeError) as e:
+            logger.debug("aiodns unavailable, using threaded DNS resolver: %s", e)
+    return aiohttp.ThreadedResolver()
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+    """Seconds to wait before retry number attempt + 1, honouring a numeric Retry-After.
+
+    Returns None when Retry-After asks for longer than _RETRY_MAX_DELAY; the caller should give up
+    rather than retry before the server allows.
+    """
+    if retry_after:
+        try:
+            delay = max(float(retry_after), 0.0)
+        except ValueError:
+            pass  # HTTP-date form; use exponential backoff instead
+        else:
+            return delay if delay <= _RETRY_MAX_DELAY else None
+    return min(_RETRY_BASE_DELAY * 2 ** attempt, _RETRY_MAX_DELAY) + random.random() * 0.25
+
+
+@lru_cache(maxsize=4096)
+def _tag_of(url: str) -> Optional[str]:
+    """Affiliate tag query value of url, or None when absent."""
+    tag_match = _TAG_RE.search(url)
+    return tag_match.group(1) if tag_match else None
+
+
+def _cache_key(url: str) -> str:
+    """Canonical marketplace+ASIN key for an Amazon product URL; other URLs key on themselves.
+
+    Tracking params, tags, slugs and subdomains (www., smile.) all collapse onto one key.
+    """
+    try:
+        parsed = urlparse(url)
+        asin_match = _ASIN_RE.search(parsed.path)
+        host = parsed.hostname or ''
+        if not asin_match or 'amazon.' not in host:
+            return url
+        marketplace = 'amazon.' + host.rsplit('amazon.', 1)[1]
+        return f"{marketplace}/dp/{asin_match.group(1).upper()}"
+    except ValueError:
+        return url
+
+@dataclass(slots=True)
 class LinkValidationResult:
     
     url: str
@@ -19,25 +102,53 @@ class LinkValidationResult:
 
 class LinkValidator:
     
+    __slots__ = (
+        'timeout', 'max_retries', 'expected_affiliate_tag',
+        'connector_limit', 'limit_per_host', 'session', '_single_flight', '_post_check',
+        '_default_timeout'
+    )
     
-    def __init__(self, timeout: int = 15, max_retries: int = 2, expected_affiliate_tag: str = None):
+    def __init__(
+        self,
+        timeout: int = 15,
+        max_retries: int = 2,
+        expected_affiliate_tag: str = None,
+        connector_limit: int = 100,
+        limit_per_host: int = 64
+    ):
         
         self.timeout = timeout
         self.max_retries = max_retries
         self.expected_affiliate_tag = expected_affiliate_tag
+        # Total pooled connections and per-host cap; batch concurrency defaults to connector_limit
+        self.connector_limit = connector_limit
+        self.limit_per_host = limit_per_host
         self.session = None
+        self._default_timeout = None
+        # Coalesces concurrent validations of the same canonical URL onto one request
+        self._single_flight = SingleFlight()
+        # Chosen once so the per-link success path carries no tag-verification branch
+        self._post_check = self._check_with_tag if expected_affiliate_tag else self._check_no_tag
         
     async def initialize(self):
         
         if self.session is None:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            if self._default_timeout is None:
+                self._default_timeout = aiohttp.ClientTimeout(total=self.timeout)
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                resolver=_build_resolver()
+            )
             
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
+                # Only status and final URL are used; ask for an uncompressed body we never read
+                'Accept-Encoding': 'identity',
                 'Cache-Control': 'no-cache',
                 'Pragma': 'no-cache',
                 'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
@@ -51,9 +162,10 @@ class LinkValidator:
             }
             
             self.session = aiohttp.ClientSession(
-                timeout=timeout,
+                timeout=self._default_timeout,
                 connector=connector,
-                headers=headers
+                headers=headers,
+                auto_decompress=False
             )
             logger.info("🔗 Link validator session initialized")
 
@@ -66,119 +178,103 @@ class LinkValidator:
 
     async def validate_link(self, url: str) -> LinkValidationResult:
         
+        rejection = self._precheck(url)
+        if rejection is not None:
+            return rejection
+        
+        key = self._result_key(url)
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            self._recheck(url, cached)
+            return replace(cached, url=url, response_time=0.0)
+        
+        result = await self._single_flight.run(key, lambda: self._validate_and_cache(url, key))
+        if result.url == url:
+            return result
+        self._recheck(url, result)
+        return replace(result, url=url)
+
+    async def _validate_and_cache(self, url: str, key: str) -> LinkValidationResult:
+        
+        result = await self._validate_link_uncached(url)
+        # Only valid links and gone pages are cached; 403s, 5xx, timeouts and rate limits may clear up
+        if result.is_valid or result.status_code in _DEFINITIVE_FAILURE_STATUSES:
+            _RESULT_CACHE.set(key, result)
+        return result
+
+    async def _validate_link_uncached(self, url: str) -> LinkValidationResult:
+        
         if not self.session:
             await self.initialize()
             
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         try:
-            if not self._is_valid_url_format(url):
-                return LinkValidationResult(
-                    url=url,
-                    is_valid=False,
-                    error_message="Invalid URL format"
-                )
-            
-            if not self._is_amazon_link(url):
-                return LinkValidationResult(
-                    url=url,
-                    is_valid=False,
-                    error_message="Not an Amazon link"
-                )
-            
             for attempt in range(self.max_retries + 1):
                 try:
-                    headers = {'Range': 'bytes=0-1023'}
+                    async with self.session.head(url, allow_redirects=True) as response:
+                        status, final_url, retry_after = response.status, str(response.url), response.headers.get('Retry-After')
                     
-                    async with self.session.get(url, headers=headers, allow_redirects=True) as response:
-                        response_time = asyncio.get_event_loop().time() - start_time
+                    if status in _HEAD_REJECTED_STATUSES:
+                        # Some endpoints refuse HEAD; fall back to a ranged GET
+                        async with self.session.get(url, headers=_RANGE_HEADERS, allow_redirects=True) as response:
+                            status, final_url, retry_after = response.status, str(response.url), response.headers.get('Retry-After')
                         
-                        if response.status in [200, 206, 416]:
-                            final_url = str(response.url)
-                            
-                            # If expected_tag is provided, verify it
-                            if self.expected_affiliate_tag:
-                                tag_valid, tag_error = self.verify_affiliate_tag(
-                                    final_url, 
-                                    self.expected_affiliate_tag
-                                )
-                                if not tag_valid:
-                                    logger.warning(f"⚠️ Affiliate tag verification failed for {url[:50]}...: {tag_error}")
-                                    # Still return valid=True for URL, but log the warning
-                            
-                            logger.debug(f"✅ Link validated: {url[:50]}... ({response.status})")
-                            return LinkValidationResult(
-                                url=url,
-                                is_valid=True,
-                                status_code=response.status,
-                                redirect_url=final_url if final_url != url else None,
-                                response_time=response_time
-                            )
-                        elif response.status == 405:
-                            async with self.session.get(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=5)) as response2:
-                                if response2.status == 200:
-                                    final_url = str(response2.url)
-                                    
-                                    # Verify affiliate tag if provided
-                                    if self.expected_affiliate_tag:
-                                        tag_valid, tag_error = self.verify_affiliate_tag(
-                                            final_url,
-                                            self.expected_affiliate_tag
-                                        )
-                                        if not tag_valid:
-                                            logger.warning(f"⚠️ Affiliate tag verification failed (fallback) for {url[:50]}...: {tag_error}")
-                                    
-                                    logger.debug(f"✅ Link validated (fallback): {url[:50]}... (200 OK)")
-                                    return LinkValidationResult(
-                                        url=url,
-                                        is_valid=True,
-                                        status_code=response2.status,
-                                        redirect_url=final_url if final_url != url else None,
-                                        response_time=response_time
-                                    )
-                                else:
-                                    logger.warning(f"❌ Link failed: {url[:50]}... (Status: {response2.status})")
-                                    return LinkValidationResult(
-                                        url=url,
-                                        is_valid=False,
-                                        status_code=response2.status,
-                                        error_message=f"HTTP {response2.status}",
-                                        response_time=response_time
-                                    )
-                        else:
-                            logger.warning(f"❌ Link failed: {url[:50]}... (Status: {response.status})")
-                            return LinkValidationResult(
-                                url=url,
-                                is_valid=False,
-                                status_code=response.status,
-                                error_message=f"HTTP {response.status}",
-                                response_time=response_time
-                            )
+                        if status == 405:
+                            async with self.session.get(url, allow_redirects=True, timeout=_FALLBACK_TIMEOUT) as response:
+                                status, final_url, retry_after = response.status, str(response.url), response.headers.get('Retry-After')
+                    
+                    if status in _RETRY_STATUSES and attempt < self.max_retries:
+                        delay = _backoff_delay(attempt, retry_after)
+                        if delay is not None:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("🚦 HTTP %d on attempt %d, backing off: %s...", status, attempt + 1, url[:50])
+                            await asyncio.sleep(delay)
+                            continue
+                    
+                    response_time = loop.time() - start_time
+                    
+                    if status in _VALID_STATUSES:
+                        return self._valid_result(url, status, final_url, response_time)
+                    
+                    # Failures are summarised once per batch in validate_links_batch
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("❌ Link failed: %s... (Status: %d)", url[:50], status)
+                    return LinkValidationResult(
+                        url=url,
+                        is_valid=False,
+                        status_code=status,
+                        error_message=f"HTTP {status}",
+                        response_time=response_time
+                    )
                             
                 except asyncio.TimeoutError:
                     if attempt < self.max_retries:
-                        logger.debug(f"⏳ Timeout on attempt {attempt + 1}, retrying: {url[:50]}...")
-                        await asyncio.sleep(1)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("⏳ Timeout on attempt %d, retrying: %s...", attempt + 1, url[:50])
+                        await asyncio.sleep(_backoff_delay(attempt))
                         continue
                     else:
                         return LinkValidationResult(
                             url=url,
                             is_valid=False,
                             error_message="Request timeout",
-                            response_time=asyncio.get_event_loop().time() - start_time
+                            response_time=loop.time() - start_time
                         )
                         
                 except aiohttp.ClientError as e:
                     if attempt < self.max_retries:
-                        logger.debug(f"🔄 Client error on attempt {attempt + 1}, retrying: {str(e)[:50]}...")
-                        await asyncio.sleep(1)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("🔄 Client error on attempt %d, retrying: %s...", attempt + 1, str(e)[:50])
+                        await asyncio.sleep(_backoff_delay(attempt))
                         continue
                     else:
                         return LinkValidationResult(
                             url=url,
                             is_valid=False,
                             error_message=f"Client error: {str(e)}",
-                            response_time=asyncio.get_event_loop().time() - start_time
+                            response_time=loop.time() - start_time
                         )
                         
         except Exception as e:
@@ -187,46 +283,176 @@ class LinkValidator:
                 url=url,
                 is_valid=False,
                 error_message=f"Unexpected error: {str(e)}",
-                response_time=asyncio.get_event_loop().time() - start_time
+                response_time=loop.time() - start_time
             )
 
-    async def validate_links_batch(self, urls: List[str], max_concurrent: int = 10) -> List[LinkValidationResult]:
-        
+    async def iter_validate_links(
+        self,
+        urls: List[str],
+        max_concurrent: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, LinkValidationResult]]:
+        """Validate URLs with a bounded worker pool, yielding (index, result) as each completes."""
         if not urls:
-            return []
-            
+            return
+        
         if not self.session:
             await self.initialize()
-            
-        logger.info(f"🔍 Validating {len(urls)} links (max concurrent: {max_concurrent})")
-        
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def validate_with_semaphore(url: str) -> LinkValidationResult:
-            async with semaphore:
-                return await self.validate_link(url)
-        
-        tasks = [validate_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        validated_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"❌ Exception validating {urls[i]}: {result}")
-                validated_results.append(LinkValidationResult(
-                    url=urls[i],
-                    is_valid=False,
-                    error_message=f"Exception: {str(result)}"
-                ))
-            else:
-                validated_results.append(result)
         
-        valid_count = sum(1 for r in validated_results if r.is_valid)
-        invalid_count = len(validated_results) - valid_count
-        logger.info(f"✅ Validation complete: {valid_count} valid, {invalid_count} invalid links")
+        if max_concurrent is None:
+            max_concurrent = min(self.connector_limit, len(urls))
+        
+        pending: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(urls):
+            pending.put_nowait(item)
+        completed: asyncio.Queue = asyncio.Queue()
+        
+        async def worker():
+            while True:
+                try:
+                    index, url = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    result = await self.validate_link(url)
+                except asyncio.CancelledError:
+                    if asyncio.current_task().cancelling():
+                        raise
+                    # Not this worker being cancelled: still report the link so the consumer never waits on it
+                    result = LinkValidationResult(
+                        url=url,
+                        is_valid=False,
+                        error_message="Validation cancelled"
+                    )
+                except Exception as e:
+                    logger.error("❌ Exception validating %s: %s", url, e)
+                    result = LinkValidationResult(
+                        url=url,
+                        is_valid=False,
+                        error_message=f"Exception: {str(e)}"
+                    )
+                await completed.put((index, result))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrent, len(urls)))]
+        try:
+            for _ in range(len(urls)):
+                yield await completed.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def validate_links_batch(self, urls: List[str], max_concurrent: Optional[int] = None) -> List[LinkValidationResult]:
+        
+        if not urls:
+            return []
+        
+        if max_concurrent is None:
+            max_concurrent = min(self.connector_limit, len(urls))
+        
+        # Reject malformed and non-Amazon URLs up front so they never take a worker slot
+        validated_results: List[Optional[LinkValidationResult]] = [self._precheck(url) for url in urls]
+        
+        # Validate each distinct product once and fan the result back out to every duplicate
+        keys: List[Optional[str]] = [None] * len(urls)
+        unique: Dict[str, str] = {}
+        for i, url in enumerate(urls):
+            if validated_results[i] is None:
+                keys[i] = self._result_key(url)
+                unique.setdefault(keys[i], url)
+        unique_keys = list(unique)
+        unique_urls = list(unique.values())
+        
+        logger.info("🔍 Validating %s links (%s unique, max concurrent: %s)", len(urls), len(unique_urls), max_concurrent)
+        
+        results_by_key: Dict[str, LinkValidationResult] = {}
+        async for index, result in self.iter_validate_links(unique_urls, max_concurrent):
+            results_by_key[unique_keys[index]] = result
+        
+        for i, url in enumerate(urls):
+            if validated_results[i] is None:
+                result = results_by_key[keys[i]]
+                if result.url != url:
+                    self._recheck(url, result)
+                    result = replace(result, url=url)
+                validated_results[i] = result
+        
+        failures = Counter(r.error_message or "Unknown error" for r in validated_results if not r.is_valid)
+        invalid_count = sum(failures.values())
+        valid_count = len(validated_results) - invalid_count
+        logger.info("✅ Validation complete: %s valid, %s invalid links", valid_count, invalid_count)
+        if failures:
+            logger.warning("❌ %s links failed: %s", invalid_count, dict(failures.most_common()))
         
         return validated_results
 
+    def _valid_result(self, url: str, status: int, final_url: str, response_time: float) -> LinkValidationResult:
+        
+        self._post_check(url, final_url)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✅ Link validated: %s... (%d)", url[:50], status)
+        return LinkValidationResult(
+            url=url,
+            is_valid=True,
+            status_code=status,
+            redirect_url=final_url if final_url != url else None,
+            response_time=response_time
+        )
+
+    def _result_key(self, url: str) -> str:
+        
+        key = _cache_key(url)
+        # Differently tagged links of one product stay apart so each tag is verified
+        if self.expected_affiliate_tag:
+            key = f"{key}?tag={_tag_of(url) or ''}"
+        return key
+
+    def _recheck(self, url: str, result: LinkValidationResult) -> None:
+        """Run the tag check for url against a result shared from another URL with the same key."""
+        if result.is_valid:
+            self._post_check(url, result.redirect_url or result.url)
+
+    def _check_with_tag(self, url: str, final_url: str) -> None:
+        
+        tag_valid, tag_error = self.verify_affiliate_tag(final_url, self.expected_affiliate_tag)
+        if not tag_valid:
+            # Still return valid=True for URL, but log the warning
+            logger.warning("⚠️ Affiliate tag verification failed for %s...: %s", url[:50], tag_error)
+
+    def _check_no_tag(self, url: str, final_url: str) -> None:
+        pass
+
+    def _precheck(self, url: str) -> Optional[LinkValidationResult]:
+        
+        if not self._is_valid_url_format(url):
+            return LinkValidationResult(
+                url=url,
+                is_valid=False,
+                error_message="Invalid URL format"
+            )
+        
+        if not self._is_amazon_link(url):
+            return LinkValidationResult(
+                url=url,
+                is_valid=False,
+                error_message="Not an Amazon link"
+            )
+        
+        # A product path whose ASIN segment is malformed can only 404; query and fragment are not the path
+        try:
+            path = urlparse(url).path
+        except ValueError:
+            path = ''
+        segment = _PRODUCT_SEGMENT_RE.search(path)
+        if segment and not _ASIN_FORMAT_RE.match(segment.group(1)):
+            return LinkValidationResult(
+                url=url,
+                is_valid=False,
+                error_message="Invalid ASIN"
+            )
+        
+        return None
+
     def _is_valid_url_format(self, url: str) -> bool:
         
         try:
@@ -239,34 +465,9 @@ class LinkValidator:
         
         try:
             parsed = urlparse(url)
-            amazon_domains = [
-                'amazon.com', 'amazon.co.uk', 'amazon.de', 'amazon.fr', 
-                'amazon.it', 'amazon.es', 'amazon.ca', 'amazon.com.mx',
-                'amazon.com.br', 'amazon.in', 'amazon.co.jp', 'amazon.com.au'
-            ]
-            
-            domain = parsed.netloc.lower()
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            is_amazon = domain in amazon_domains
-            
-            # Additional validation: check if URL contains valid ASIN pattern
-            if is_amazon:
-                import re
-                # Check for ASIN in URL path (/dp/ASIN or /gp/product/ASIN)
-                asin_pattern = r'/(?:dp|gp/product)/([A-Z0-9]{10})'
-                asin_match = re.search(asin_pattern, parsed.path)
-                if asin_match:
-                    asin = asin_match.group(1)
-                    # Validate ASIN format (10 alphanumeric characters)
-                    if not re.match(r'^[A-Z0-9]{10}$', asin):
-                        logger.debug(f"Invalid ASIN format in URL: {asin}")
-                        return False
-            
-            return is_amazon
+            return parsed.netloc.lower().removeprefix('www.') in _AMAZON_DOMAINS
         except Exception as e:
-            logger.debug(f"Error validating Amazon link: {e}")
+            logger.debug("Error validating Amazon link: %s", e)
             return False
     
     def verify_affiliate_tag(self, url: str, expected_tag: str) -> tuple:
@@ -279,17 +480,10 @@ class LinkValidator:
             return False, "Missing URL or affiliate tag"
         
         try:
-            from urllib.parse import urlparse, parse_qs
-            
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-            
-            # Check for tag parameter
-            tag_values = params.get('tag', [])
-            if not tag_values:
+            actual_tag = _tag_of(url)
+            if actual_tag is None:
                 return False, "No 'tag' parameter found in URL"
             
-            actual_tag = tag_values[0]
             if actual_tag != expected_tag:
                 return False, f"Tag mismatch: expected '{expected_tag}', got '{actual_tag}'"
             
@@ -303,22 +497,29 @@ class LinkValidator:
         if not results:
             return {}
             
-        valid_results = [r for r in results if r.is_valid]
-        invalid_results = [r for r in results if not r.is_valid]
-        
+        total = len(results)
+        valid = 0
         error_types = {}
-        for result in invalid_results:
-            error = result.error_message or "Unknown error"
-            error_types[error] = error_types.get(error, 0) + 1
+        response_time_sum = 0.0
+        response_time_count = 0
+        
+        for result in results:
+            if result.is_valid:
+                valid += 1
+            else:
+                error = result.error_message or "Unknown error"
+                error_types[error] = error_types.get(error, 0) + 1
+            if result.response_time > 0:
+                response_time_sum += result.response_time
+                response_time_count += 1
         
-        response_times = [r.response_time for r in results if r.response_time > 0]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+        avg_response_time = response_time_sum / response_time_count if response_time_count else 0
         
         return {
-            'total_links': len(results),
-            'valid_links': len(valid_results),
-            'invalid_links': len(invalid_results),
-            'success_rate': len(valid_results) / len(results) * 100 if results else 0,
+            'total_links': total,
+            'valid_links': valid,
+            'invalid_links': total - valid,
+            'success_rate': valid / total * 100,
             'average_response_time': round(avg_response_time, 3),
             'error_breakdown': error_types
         }
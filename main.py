@@ -17,7 +17,7 @@ if sys.version_info < (3, 11):
     sys.exit(1)
 
 
-from config import Config
+from config import get_config
 from telegram_bot import AffiliateBot
 from web_dashboard_clean import create_app
 from scheduler import TaskScheduler
@@ -50,7 +50,7 @@ class DealBotApplication:
     
     def __init__(self):
         
-        self.config = Config()
+        self.config = get_config()
         self.running = False
         self.bot: Optional[AffiliateBot] = None
         self.db_manager = None  # Can be DatabaseManager or SimpleDatabaseManager
@@ -1,6 +1,10 @@
 import asyncio
+import heapq
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from config import Config
 from core.telemetry import metrics
 
@@ -15,6 +19,14 @@ class TaskScheduler:
         self.config = config
         self.running = False
         self.tasks = []
+        self.monitor = PerformanceMonitor()
+        self._schedule: List[Tuple[float, int, str]] = []
+        # name -> (job, interval seconds, retry delay seconds after a failure)
+        self._jobs: Dict[str, Tuple[Callable[[], Awaitable[None]], float, float]] = {}
+        # Due jobs run as their own tasks so a slow one doesn't hold back the others;
+        # a finishing job sets _wakeup so the loop sees its new deadline
+        self._running_jobs: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
         
     async def start(self):
         
@@ -28,20 +40,10 @@ class TaskScheduler:
                 )
                 self.tasks.append(watchdog_task)
 
-                deal_posting_task = tg.create_task(
-                    self._schedule_deal_posting()
+                run_task = tg.create_task(
+                    self._run_loop()
                 )
-                self.tasks.append(deal_posting_task)
-                
-                cleanup_task = tg.create_task(
-                    self._schedule_database_cleanup()
-                )
-                self.tasks.append(cleanup_task)
-                
-                stats_task = tg.create_task(
-                    self._schedule_stats_update()
-                )
-                self.tasks.append(stats_task)
+                self.tasks.append(run_task)
                 
                 logger.info("✅ All scheduled tasks started")
         except Exception as e:
@@ -56,9 +58,7 @@ class TaskScheduler:
         
         tasks = [
             asyncio.create_task(self._watchdog_loop()),
-            asyncio.create_task(self._schedule_deal_posting()),
-            asyncio.create_task(self._schedule_database_cleanup()),
-            asyncio.create_task(self._schedule_stats_update())
+            asyncio.create_task(self._run_loop())
         ]
         
         self.tasks.extend(tasks)
@@ -82,79 +82,108 @@ class TaskScheduler:
         
         logger.info("✅ Task scheduler stopped")
     
-    async def _schedule_deal_posting(self):
+    async def _run_loop(self):
+        """Run every periodic job from one timer, always sleeping until the nearest deadline."""
+        now = time.monotonic()
+        self._jobs = {
+            'deal_posting': (self._post_deals, self.config.POST_INTERVAL_MINUTES * 60, 300),
+            'cleanup': (self._cleanup_database, 24 * 3600, 3600),
+            'stats': (self._update_stats, 3600, 1800),
+        }
+        self._schedule = [
+            (now + 60, 0, 'deal_posting'),
+            (now + 300, 1, 'cleanup'),
+            (now + 120, 2, 'stats'),
+        ]
+        heapq.heapify(self._schedule)
         
         logger.info(f"📋 Deal posting scheduled every {self.config.POST_INTERVAL_MINUTES} minutes")
+        logger.info("🧹 Database cleanup scheduled daily")
+        logger.info("📊 Statistics update scheduled every hour")
         
-        await asyncio.sleep(60)
+        try:
+            while self.running:
+                delay = None
+                while self._schedule:
+                    deadline, order, name = self._schedule[0]
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        break
+                    heapq.heappop(self._schedule)
+                    self._start_job(order, name)
+                    delay = None
+                # delay is None while every job is running; wait for one to finish and reschedule
+                await self._wait(delay)
+        except asyncio.CancelledError:
+            logger.info("Scheduler loop cancelled")
+        finally:
+            for task in self._running_jobs:
+                task.cancel()
+    
+    def _start_job(self, order: int, name: str):
         
-        while self.running:
-            try:
-                metrics.increment("scheduler.deal_posting_runs")
-                logger.info("🔄 Starting scheduled deal posting...")
-                
-                posted_count = await self.bot.post_deals()
-                
-                if posted_count > 0:
-                    logger.info(f"✅ Scheduled posting: {posted_count} deals posted")
-                else:
-                    logger.info("ℹ️ Scheduled posting: No new deals to post")
-                
-                await asyncio.sleep(self.config.POST_INTERVAL_MINUTES * 60)
-                
-            except asyncio.CancelledError:
-                logger.info("Deal posting task cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error in scheduled deal posting: {e}")
-                await asyncio.sleep(300)
+        task = asyncio.create_task(self._run_job(order, name))
+        self._running_jobs.add(task)
+        task.add_done_callback(self._running_jobs.discard)
     
-    async def _schedule_database_cleanup(self):
+    async def _run_job(self, order: int, name: str):
+        """Run one job and put it back on the heap after interval (or retry_delay on failure)."""
+        job, interval, retry_delay = self._jobs[name]
+        started = time.perf_counter()
+        try:
+            await job()
+            success = True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error in scheduled {name.replace('_', ' ')}: {e}")
+            success = False
+        self.monitor.record_task_execution(name, time.perf_counter() - started, success)
         
-        logger.info("🧹 Database cleanup scheduled daily")
+        next_delay = interval if success else retry_delay
+        heapq.heappush(self._schedule, (time.monotonic() + next_delay, order, name))
+        self._wakeup.set()
+    
+    async def _wait(self, delay: Optional[float]):
+        """Sleep until delay elapses (forever if None) or a finished job wakes the loop."""
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _post_deals(self):
         
-        await asyncio.sleep(300)
+        metrics.increment("scheduler.deal_posting_runs")
+        logger.info("🔄 Starting scheduled deal posting...")
         
-        while self.running:
-            try:
-                metrics.increment("scheduler.cleanup_runs")
-                logger.info("🧹 Starting scheduled database cleanup...")
-                
-                deleted_count = await self.bot.db_manager.cleanup_old_deals(days=30)
-                
-                if deleted_count > 0:
-                    logger.info(f"✅ Database cleanup: Removed {deleted_count} old deals")
-                else:
-                    logger.info("ℹ️ Database cleanup: No old deals to remove")
-                
-                await asyncio.sleep(24 * 3600)
-                
-            except asyncio.CancelledError:
-                logger.info("Database cleanup task cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error in scheduled database cleanup: {e}")
-                await asyncio.sleep(3600)
+        posted_count = await self.bot.post_deals()
+        
+        if posted_count > 0:
+            logger.info(f"✅ Scheduled posting: {posted_count} deals posted")
+        else:
+            logger.info("ℹ️ Scheduled posting: No new deals to post")
     
-    async def _schedule_stats_update(self):
+    async def _cleanup_database(self):
         
-        logger.info("📊 Statistics update scheduled every hour")
-        await asyncio.sleep(120)
-        while self.running:
-            try:
-                metrics.increment("scheduler.stats_runs")
-                logger.info("📊 Updating statistics...")
-                stats = await self.bot.db_manager.get_deal_stats()
-                if stats:
-                    logger.info(f"📊 Current stats: {stats.total_deals} deals, "
-                                f"{stats.total_clicks} clicks, ${stats.total_earnings:.2f} earnings")
-                await asyncio.sleep(3600)
-            except asyncio.CancelledError:
-                logger.info("Statistics update task cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error in scheduled stats update: {e}")
-                await asyncio.sleep(1800)
+        metrics.increment("scheduler.cleanup_runs")
+        logger.info("🧹 Starting scheduled database cleanup...")
+        
+        deleted_count = await self.bot.db_manager.cleanup_old_deals(days=30)
+        
+        if deleted_count > 0:
+            logger.info(f"✅ Database cleanup: Removed {deleted_count} old deals")
+        else:
+            logger.info("ℹ️ Database cleanup: No old deals to remove")
+    
+    async def _update_stats(self):
+        
+        metrics.increment("scheduler.stats_runs")
+        logger.info("📊 Updating statistics...")
+        stats = await self.bot.db_manager.get_deal_stats()
+        if stats:
+            logger.info(f"📊 Current stats: {stats.total_deals} deals, "
+                        f"{stats.total_clicks} clicks, ${stats.total_earnings:.2f} earnings")
 
     async def _watchdog_loop(self, interval: int = 300):
         """Emit scheduler heartbeat metric to detect dead loops."""
@@ -208,6 +237,11 @@ class TaskScheduler:
         
         now = datetime.now()
         
+        for deadline, _, name in self._schedule:
+            if name == task_type:
+                remaining = max(0.0, deadline - time.monotonic())
+                return (now + timedelta(seconds=remaining)).strftime("%Y-%m-%d %H:%M:%S")
+        
         match task_type:
             case 'deal_posting':
                 next_run = now + timedelta(minutes=self.config.POST_INTERVAL_MINUTES)
@@ -221,42 +255,45 @@ class TaskScheduler:
         return next_run.strftime("%Y-%m-%d %H:%M:%S")
 
 
+@dataclass(slots=True)
+class TaskMetrics:
+    executions: int = 0
+    total_duration: float = 0.0
+    successes: int = 0
+    failures: int = 0
+    last_execution: Optional[datetime] = None
+
+
 class PerformanceMonitor:
     
     
     def __init__(self):
-        self.task_metrics = {}
+        self.task_metrics: Dict[str, TaskMetrics] = {}
         self.error_counts = {}
         
     def record_task_execution(self, task_name: str, duration: float, success: bool):
         
-        if task_name not in self.task_metrics:
-            self.task_metrics[task_name] = {
-                'executions': 0,
-                'total_duration': 0.0,
-                'successes': 0,
-                'failures': 0,
-                'last_execution': None
-            }
+        entry = self.task_metrics.get(task_name)
+        if entry is None:
+            entry = self.task_metrics[task_name] = TaskMetrics()
         
-        metrics = self.task_metrics[task_name]
-        metrics['executions'] += 1
-        metrics['total_duration'] += duration
-        metrics['last_execution'] = datetime.now()
+        entry.executions += 1
+        entry.total_duration += duration
+        entry.last_execution = datetime.now()
         
         if success:
-            metrics['successes'] += 1
+            entry.successes += 1
         else:
-            metrics['failures'] += 1
+            entry.failures += 1
     
     def get_task_health(self, task_name: str) -> dict:
         
-        if task_name not in self.task_metrics:
+        entry = self.task_metrics.get(task_name)
+        if entry is None:
             return {'status': 'unknown', 'message': 'No execution data'}
         
-        metrics = self.task_metrics[task_name]
-        success_rate = metrics['successes'] / metrics['executions'] if metrics['executions'] > 0 else 0
-        avg_duration = metrics['total_duration'] / metrics['executions'] if metrics['executions'] > 0 else 0
+        success_rate = entry.successes / entry.executions if entry.executions > 0 else 0
+        avg_duration = entry.total_duration / entry.executions if entry.executions > 0 else 0
         
         if success_rate >= 0.9:
             status = 'healthy'
@@ -269,6 +306,6 @@ class PerformanceMonitor:
             'status': status,
             'success_rate': success_rate,
             'average_duration': avg_duration,
-            'total_executions': metrics['executions'],
-            'last_execution': metrics['last_execution'].isoformat() if metrics['last_execution'] else None
+            'total_executions': entry.executions,
+            'last_execution': entry.last_execution.isoformat() if entry.last_execution else None
         }
@@ -5,34 +5,452 @@ Fetches latest and catchy deals from Amazon Associates sources.
 """
 
 import asyncio
+import heapq
+from bisect import bisect_right
 import logging
 import aiohttp
+import random
 import re
-from typing import List, Optional, Dict, Tuple
+import soupsieve
+from dataclasses import replace
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.filter import ElementFilter
+from lxml import etree
+from core.cache import SingleFlight, TTLCache
 from models import Product
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 logger = logging.getLogger(__name__)
 
+_ASIN_RE = re.compile(r'/(?:dp|gp/product)/([A-Z0-9]{10})')
+_PRICE_CLASS_RE = re.compile(r'price|Price')
+_RATING_CLASS_RE = re.compile(r'star|rating|Rating')
+_REVIEW_HREF_RE = re.compile(r'reviews|ratings')
+_IMAGE_SIZE_RE = re.compile(r'\._[A-Z0-9,]+_\.')
+_PRICE_NUMBER_RE = re.compile(r'[\d,]+\.?\d*')
+_DISCOUNT_PERCENT_RE = re.compile(r'(\d+)%')
+_PERCENT_RE = re.compile(r'(\d+)\s*%')
+_RATING_RES = tuple(re.compile(pattern) for pattern in (
+    r'(\d+\.?\d*)\s*out of',  # "4.5 out of 5"
+    r'(\d+\.?\d*)\s*stars?',  # "4.5 stars"
+    r'(\d+\.?\d*)\s*\/\s*5',  # "4.5/5"
+    r'rating[:\s]+(\d+\.?\d*)',  # "rating: 4.5"
+    r'(\d+\.?\d*)',  # Just a number
+))
+_REVIEW_THOUSANDS_RE = re.compile(r'([\d.]+)\s*[kK]')
+_REVIEW_NUMBER_RE = re.compile(r'([\d,]+)')
+# Amazon result pages run 1-2 MB uncompressed; anything far beyond that is not a deal page
+_MAX_PAGE_BYTES = 4 * 1024 * 1024
+
+_REF_PATH_SEGMENT_RE = re.compile(r'/ref=[^/]*\Z')
+_BLOCKED_PAGE_RE = re.compile(rb'captcha|robot|access denied', re.IGNORECASE)
+
+# Score tiers for _score_deal: bisect_right(thresholds, value) indexes the points table
+_RATING_THRESHOLDS = (3.5, 4.0, 4.5)
+_RATING_POINTS = (0, 10, 20, 30)
+_REVIEW_THRESHOLDS = (50, 100, 500, 1000)
+_REVIEW_POINTS = (0, 5, 10, 15, 20)
+_FRESHNESS_LIMITS = (timedelta(hours=1), timedelta(hours=6), timedelta(hours=24))
+_FRESHNESS_POINTS = (10, 7, 5, 0)
+_DEAL_BADGE_RE = re.compile(r'lightning|limited', re.IGNORECASE)
+
+# URL checks for scrape_specific_deal; the host must be an Amazon storefront or one of its subdomains
+_VALID_SCHEMES = ('http://', 'https://')
+_AMAZON_HOSTS = frozenset({'amazon.com', 'amazon.co.uk', 'amazon.de', 'amazon.fr',
+                           'amazon.ca', 'amazon.com.au', 'amazon.co.jp', 'amazon.in'})
+_AMAZON_HOST_SUFFIXES = tuple('.' + host for host in _AMAZON_HOSTS)
+_SUSPICIOUS_RE = re.compile(r'javascript:|data:|vbscript:|<script')
+
+# `.cls` / `tag.cls` selectors can use find(), which skips soupsieve's CSS compile and match machinery
+_SIMPLE_CLASS_SELECTOR_RE = re.compile(r'([a-z][a-z0-9]*)?\.([\w-]+)\Z')
+# Likewise `[data-x]` / `tag[data-x="v"]`; limited to data-/aria- attributes, whose values match case-sensitively
+# in CSS and are single-valued in bs4, so find() gives exactly the soupsieve result
+_SIMPLE_ATTR_SELECTOR_RE = re.compile(r'([a-z][a-z0-9]*)?\[((?:data|aria)-[\w-]+)(?:="([^"]*)")?\]\Z')
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a whole class token, like the CSS `.name` selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Product pages are queried straight off the lxml tree; each tuple is tried in order like a selector list
+_PRODUCT_TITLE_XPATHS = (
+    etree.XPath(f"(//*[{_has_class('product-title')}])[1]"),
+    etree.XPath(f"(//h1[{_has_class('a-size-large')}])[1]"),
+)
+_PRODUCT_PRICE_XPATHS = (
+    etree.XPath(f"(//*[{_has_class('a-price-whole')}])[1]"),
+    etree.XPath(f"(//*[{_has_class('a-price')}]//*[{_has_class('a-offscreen')}])[1]"),
+    etree.XPath(f"(//*[{_has_class('price')}]//*[{_has_class('a-price-whole')}])[1]"),
+)
+_PRODUCT_DISCOUNT_XPATHS = (
+    etree.XPath(f"(//*[{_has_class('savingsPercentage')}])[1]"),
+    etree.XPath(f"(//*[{_has_class('a-badge-text')}])[1]"),
+)
+# Each field is settled once the first-priority selector of its list has matched a closed element;
+# a later alternative (badge text, offscreen price) may still be overridden further down the page
+_PRODUCT_FIELD_MATCHERS = tuple(
+    etree.XPath(f"boolean(self::*[{_has_class(name)}])")
+    for name in ('product-title', 'a-price-whole', 'savingsPercentage')
+)
+# Cheap prefilter so the matchers only run on elements carrying one of the classes they test for
+_PRODUCT_FIELD_CLASS_RE = re.compile(r'product-title|a-price-whole|savingsPercentage')
+
+# Classes of the containers DEAL_CONTAINER_SELECTORS looks for besides data-asin/data-component-type ones
+_DEAL_CONTAINER_CLASSES = frozenset({'s-result-item', 'DealCard', 'dealContainer', 's-card-container', 's-card-border'})
+
+
+class _DealContainerFilter(ElementFilter):
+    """Builds only the subtrees DEAL_CONTAINER_SELECTORS can match; nav, footer and scripts are skipped.
+
+    Descendant selectors such as `.s-main-slot .s-result-item` lose their ancestor, but the bare
+    `.s-result-item` entry still matches the same containers.
+    """
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if not attrs:
+            return False
+        if 'data-asin' in attrs or 'data-component-type' in attrs:
+            return True
+        classes = attrs.get('class')
+        if not classes:
+            return False
+        if isinstance(classes, str):
+            classes = classes.split()
+        return not _DEAL_CONTAINER_CLASSES.isdisjoint(classes)
+
+    def allow_string_creation(self, string: str) -> bool:
+        # Only reached for text outside every kept container
+        return False
+
+
+_DEAL_STRAINER = _DealContainerFilter()
+
+
+def _make_soup(
+    markup, parse_only: Optional[ElementFilter] = None, from_encoding: Optional[str] = None
+) -> BeautifulSoup:
+    """Parse with the libxml2-backed lxml parser, falling back to html.parser when lxml is missing.
+
+    Raw bytes are decoded by the parser itself; from_encoding (e.g. the HTTP charset) skips sniffing.
+    """
+    try:
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only, from_encoding=from_encoding)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', parse_only=parse_only, from_encoding=from_encoding)
+
+
+async def _read_capped(response: aiohttp.ClientResponse, limit: int) -> Tuple[bytes, bool]:
+    """Read at most limit bytes of the body; returns (body, truncated)."""
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            return b''.join(chunks)[:limit], True
+    return b''.join(chunks), False
+
+
+async def _parse_product_stream(response: aiohttp.ClientResponse, limit: int):
+    """Incrementally parse a product page, stopping once the preferred title, price and discount elements have closed.
+
+    The rest of the page (reviews, recommendations, footer) is never downloaded or parsed. Returns the
+    root of the (possibly partial) tree.
+    """
+    parser = etree.HTMLPullParser(events=('end',), encoding=response.charset)
+    pending = list(_PRODUCT_FIELD_MATCHERS)
+    size = 0
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        parser.feed(chunk)
+        size += len(chunk)
+        for _, element in parser.read_events():
+            classes = element.get('class')
+            if classes and _PRODUCT_FIELD_CLASS_RE.search(classes):
+                pending = [matcher for matcher in pending if not matcher(element)]
+        if not pending or size >= limit:
+            break
+    return parser.close()
+
+
+def _canonical_source_url(url: str) -> str:
+    """Strip Amazon's ref= tracking (path segment or query param), which never changes page content."""
+    parts = urlsplit(url)
+    path = _REF_PATH_SEGMENT_RE.sub('', parts.path)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'ref'])
+    return urlunsplit((parts.scheme, parts.netloc, path, query, parts.fragment))
+
+
+def _dedupe_sources(urls: Iterable[str]) -> List[str]:
+    """Canonical source URLs in first-seen order, without duplicates."""
+    urls = list(urls)
+    unique = list(dict.fromkeys(_canonical_source_url(url) for url in urls))
+    if len(unique) < len(urls) and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Dropped %d duplicate source URLs: %s", len(urls) - len(unique), unique)
+    return unique
+
+
+@lru_cache(maxsize=None)
+def _compiled_selector(selector: str):
+    """(tag name, attrs) for simple class/attribute selectors, otherwise the compiled soupsieve selector."""
+    simple = _SIMPLE_CLASS_SELECTOR_RE.match(selector)
+    if simple:
+        return simple.group(1) or True, {'class': simple.group(2)}
+    simple = _SIMPLE_ATTR_SELECTOR_RE.match(selector)
+    if simple:
+        value = simple.group(3)
+        return simple.group(1) or True, {simple.group(2): True if value is None else value}
+    return soupsieve.compile(selector)
+
+
+def _select_first(element, selector: str):
+    """element.select_one(selector) using the selector compiled once per process."""
+    compiled = _compiled_selector(selector)
+    if isinstance(compiled, tuple):
+        return element.find(compiled[0], attrs=compiled[1])
+    return compiled.select_one(element)
+
+
+def _select_all(element, selector: str) -> list:
+    """element.select(selector) using the selector compiled once per process."""
+    compiled = _compiled_selector(selector)
+    if isinstance(compiled, tuple):
+        return element.find_all(compiled[0], attrs=compiled[1])
+    return compiled.select(element)
+
+
+# Text normalisers below are pure functions of the scraped string; overlapping sources repeat
+# the same price, rating and badge strings, so results are memoised.
+
+@lru_cache(maxsize=4096)
+def _clean_price_text(price_text: str) -> str:
+    if not price_text:
+        return "Price not available"
+    price_match = _PRICE_NUMBER_RE.search(price_text.replace(',', ''))
+    if price_match:
+        return f"${price_match.group()}"
+    return price_text[:50]
+
+
+@lru_cache(maxsize=4096)
+def _clean_discount_text(discount_text: str) -> str:
+    if not discount_text:
+        return ""
+    percent_match = _DISCOUNT_PERCENT_RE.search(discount_text)
+    if percent_match:
+        return f"{percent_match.group(1)}% off"
+    return discount_text[:20]
+
+
+@lru_cache(maxsize=4096)
+def _parse_rating(rating_text: str) -> float:
+    if not rating_text:
+        return 0.0
+    
+    # Try multiple patterns
+    rating_text_lower = rating_text.lower()
+    for pattern in _RATING_RES:
+        rating_match = pattern.search(rating_text_lower)
+        if rating_match:
+            try:
+                rating = float(rating_match.group(1))
+                # Validate rating is between 0 and 5
+                if 0 <= rating <= 5:
+                    return rating
+            except ValueError:
+                continue
+    
+    return 0.0
+
+
+@lru_cache(maxsize=4096)
+def _parse_review_count(review_text: str) -> int:
+    if not review_text:
+        return 0
+    
+    # Handle formats like "1,234", "1.2k", "1.5K", etc.
+    review_text_clean = review_text.replace(',', '').strip()
+    
+    # Check for "k" or "K" suffix (thousands)
+    k_match = _REVIEW_THOUSANDS_RE.search(review_text_clean)
+    if k_match:
+        try:
+            return int(float(k_match.group(1)) * 1000)
+        except ValueError:
+            pass
+    
+    # Regular number match
+    number_match = _REVIEW_NUMBER_RE.search(review_text_clean)
+    if number_match:
+        try:
+            return int(number_match.group(1).replace(',', ''))
+        except ValueError:
+            pass
+    
+    return 0
+
+
+@lru_cache(maxsize=4096)
+def _parse_discount_percentage(discount_text: str) -> float:
+    if not discount_text:
+        return 0.0
+    
+    # Look for percentage patterns: "20%", "20% off", "Save 20%", etc.
+    percent_match = _PERCENT_RE.search(discount_text)
+    if percent_match:
+        return float(percent_match.group(1))
+    
+    return 0.0
+
+
+_CATEGORY_KEYWORDS = (
+    ('electronics', ('phone', 'tablet', 'laptop', 'speaker', 'headphone', 'camera', 'tv', 'smart', 'wireless')),
+    ('home', ('kitchen', 'cooking', 'chair', 'table', 'lamp', 'bed', 'pillow', 'blanket')),
+    ('fashion', ('shirt', 'pants', 'dress', 'shoes', 'jacket', 'jeans', 'clothing')),
+    ('sports', ('fitness', 'exercise', 'gym', 'workout', 'sports', 'running', 'yoga')),
+    ('beauty', ('beauty', 'skincare', 'makeup', 'hair', 'cosmetic', 'shampoo')),
+    ('books', ('book', 'kindle', 'novel', 'textbook', 'magazine')),
+)
+
+
+def _build_category_matcher() -> Tuple[Dict[str, int], re.Pattern]:
+    """Map each keyword to its category's priority and compile one pattern that finds all of them."""
+    ranks: Dict[str, int] = {}
+    for rank, (_, keywords) in enumerate(_CATEGORY_KEYWORDS):
+        for keyword in keywords:
+            ranks.setdefault(keyword, rank)
+    # The lookahead lets occurrences overlap; alternatives are listed in category order so the
+    # highest-priority keyword starting at a position wins (e.g. 'tablet' over 'table')
+    pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in ranks) + '))')
+    return ranks, pattern
+
+
+_KEYWORD_CATEGORY_RANK, _CATEGORY_KEYWORD_RE = _build_category_matcher()
+
+
+@lru_cache(maxsize=4096)
+def _categorize(title_lower: str) -> str:
+    ranks = [_KEYWORD_CATEGORY_RANK[match] for match in _CATEGORY_KEYWORD_RE.findall(title_lower)]
+    return _CATEGORY_KEYWORDS[min(ranks)][0] if ranks else 'general'
+
 
 class DealScraper:
     """Real-time Amazon deal scraper with no mock data."""
     
+    # Prioritize deal-specific selectors first - expanded list for better coverage
+    DEAL_CONTAINER_SELECTORS = (
+        '[data-component-type="s-deals-result"]',  # Deal-specific results
+        '[data-component-type="s-search-result"]',  # Search results
+        '.s-result-item[data-asin]',  # Results with ASIN
+        '[data-asin]',  # Any element with ASIN
+        '.s-result-item',  # Generic result items
+        '.DealCard',  # Deal cards
+        '.dealContainer',  # Deal containers
+        '.s-main-slot .s-result-item',  # Main slot results
+        '.s-result-list .s-result-item',  # Result list items
+        'div[data-asin]',  # Divs with ASIN
+        '.s-card-container',  # Card containers
+        '.s-card-border',  # Card borders
+    )
+    TITLE_SELECTORS = (
+        'h2 a span.a-text-normal',
+        'h3 a span',
+        'h2 a span',
+        '[data-cy="title-recipe-collection"]',
+        '.s-size-mini span',
+        '.a-link-normal span',
+        '.a-text-normal',
+        'span.a-text-normal',
+        'a.a-link-normal span',
+        'h2 span',
+        'h3 span',
+    )
+    PRICE_SELECTORS = (
+        '.a-price-whole',
+        '.a-price .a-offscreen',
+        '.a-offscreen',
+        '.a-price',
+        '[data-a-color="price"]',
+        '.a-price-symbol',
+        '.a-price-fraction',
+        'span.a-price',
+        '.s-price-instructions-style',
+    )
+    # Improved discount extraction with more selectors
+    DISCOUNT_SELECTORS = (
+        '.savingsPercentage',
+        '.a-badge-text',
+        '[data-a-badge-color="sx-lightning-deal-red"]',
+        '.a-size-base.a-color-price',  # Price savings
+        '.a-color-price',  # Price color indicators
+        '[aria-label*="%"]',  # Any element with percentage
+    )
+    DEAL_BADGE_SELECTORS = (
+        '[data-a-badge-color="sx-lightning-deal-red"]',
+        '.a-badge-text:-soup-contains("Lightning")',
+        '.a-badge-text:-soup-contains("Deal")',
+        '.a-badge-text:-soup-contains("Limited")',
+    )
+    RATING_SELECTORS = (
+        '.a-icon-alt',
+        '[aria-label*="stars"]',
+        '[aria-label*="out of"]',
+        '.a-icon-star',
+        'span[aria-label]',
+    )
+    REVIEW_SELECTORS = (
+        '.a-size-base',
+        'a[href*="#customerReviews"]',
+        '.a-link-normal',
+        'span.a-size-base',
+    )
+    IMAGE_SELECTORS = (
+        'img[data-image-latency]',
+        '.s-image',
+        'img.a-dynamic-image',
+        '[data-image-index="0"] img',
+        'img.s-image',
+        '.s-product-image-container img',
+        'img[data-a-dynamic-image]',
+        '.a-dynamic-image',
+        'img[src*="images-amazon"]'
+    )
+    DESCRIPTION_SELECTORS = (
+        '.a-size-base-plus',
+        '.s-color-secondary',
+        '[data-cy="secondary-recipe-collection"]'
+    )
+    
     def __init__(self, max_deals_per_source: int = 5, request_timeout: int = 30):
         """Initialize scraper with configuration."""
         self.max_deals_per_source = max_deals_per_source
         self.request_timeout = request_timeout
         self.session = None
+        self._connector = None
+        # Product pages change over hours, so a repeat scrape of the same URL within 15 minutes is served from memory
+        self._product_cache = TTLCache(maxsize=2048, ttl=900)
+        self._single_flight = SingleFlight()
         # Prioritize deal pages over generic search results
         # Order matters - more specific deal pages first
-        self.amazon_sources = [
+        configured_sources = [
             "https://www.amazon.com/gp/goldbox/ref=nav_cs_gb",  # Today's Deals
             "https://www.amazon.com/gp/goldbox/ref=nav_cs_gb_azl",  # Lightning Deals
             "https://www.amazon.com/deals",  # Best Deals
             "https://www.amazon.com/gp/goldbox",  # Goldbox (fallback)
             "https://www.amazon.com/s?k=deals&i=specialty-aps&ref=sr_pg_1",  # Deals search
         ]
+        # ref= variants serve the same page; fetch each distinct page once
+        self.amazon_sources = _dedupe_sources(configured_sources)
+        # Result budget stays per configured source so collapsing ref= variants doesn't shrink it
+        self.max_total_deals = max_deals_per_source * len(configured_sources)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
@@ -45,7 +463,8 @@ class DealScraper:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0',
         }
-        self.rate_limit_delay = 5
+        # All sources share one host; cap in-flight page fetches to stay polite
+        self._source_semaphore = asyncio.Semaphore(2)
         # Deal quality thresholds
         self.MIN_DISCOUNT_PERCENT = 20  # Minimum 20% discount
         self.MIN_RATING = 4.0  # Minimum 4.0 stars
@@ -53,18 +472,36 @@ class DealScraper:
         self.deal_timestamps: Dict[str, datetime] = {}  # Track when deals were first seen
         
     async def initialize(self):
-        """Initialize async session."""
+        """Initialize async session.
+
+        The session and its keep-alive pool are shared by every scrape method;
+        callers should reuse this scraper rather than open per-request sessions.
+        """
         if not self.session:
-            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            # sock_read bounds a stalled body read independently of the overall budget
+            timeout = aiohttp.ClientTimeout(total=self.request_timeout, sock_read=10)
+            self._connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            # headers advertise gzip/br; the brotli package lets aiohttp decode br bodies
             self.session = aiohttp.ClientSession(
                 timeout=timeout,
-                headers=self.headers
+                connector=self._connector,
+                headers=self.headers,
+                auto_decompress=True
             )
             
     async def close(self):
         """Close session."""
         if self.session:
             await self.session.close()
+            self.session = None
+        if self._connector:
+            await self._connector.close()
+            self._connector = None
             
     async def scrape_real_amazon_deals(self) -> List[Product]:
         """Scrape real Amazon deals from multiple sources, prioritizing latest and catchy deals."""
@@ -73,74 +510,82 @@ class DealScraper:
             
         all_deals = []
         
-        for source_url in self.amazon_sources:
-            try:
-                logger.info(f"Scraping real deals from: {source_url}")
-                deals = await self._scrape_source(source_url)
-                all_deals.extend(deals)
-                
-                # Exponential backoff on rate limiting
-                await asyncio.sleep(self.rate_limit_delay)
-                
-            except Exception as e:
-                logger.warning(f"Failed to scrape {source_url}: {e}")
+        logger.info("Scraping real deals from %s sources", len(self.amazon_sources))
+        # Shared by all sources so products repeated across overlapping pages are only extracted once
+        seen_asins: set = set()
+        results = await asyncio.gather(
+            *(self._scrape_source(source_url, seen_asins) for source_url in self.amazon_sources),
+            return_exceptions=True
+        )
+        
+        for source_url, result in zip(self.amazon_sources, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to scrape %s: %s", source_url, result)
                 continue
+            all_deals.extend(result)
         
         # Remove duplicates by ASIN
         unique_deals = []
-        seen_asins = set()
+        unique_asins = set()
         
         for deal in all_deals:
-            if deal.asin and deal.asin not in seen_asins:
+            if deal.asin and deal.asin not in unique_asins:
                 unique_deals.append(deal)
-                seen_asins.add(deal.asin)
+                unique_asins.add(deal.asin)
                 # Track when deal was first seen
                 if deal.asin not in self.deal_timestamps:
                     self.deal_timestamps[deal.asin] = datetime.now()
         
-        logger.info(f"Scraped {len(unique_deals)} unique deals from Amazon")
+        logger.info("Scraped %s unique deals from Amazon", len(unique_deals))
         
         if len(unique_deals) == 0:
             logger.warning("⚠️ No deals scraped at all. This may indicate Amazon HTML structure changed or rate limiting.")
             return []
         
+        # Discount percentage, rating and review count are derived once and shared by every pass below
+        deal_stats = [
+            (deal, self._extract_discount_percentage(deal.discount), deal.rating or 0.0, deal.review_count or 0)
+            for deal in unique_deals
+        ]
+        
         # Filter for catchy deals (meet quality thresholds)
-        catchy_deals = self._filter_catchy_deals(unique_deals)
-        logger.info(f"Filtered to {len(catchy_deals)} catchy deals (min {self.MIN_DISCOUNT_PERCENT}% off, {self.MIN_RATING}+ stars, {self.MIN_REVIEWS}+ reviews)")
+        catchy_deals = self._filter_catchy_deals(deal_stats)
+        logger.info("Filtered to %s catchy deals (min %s%% off, %s+ stars, %s+ reviews)",
+                    len(catchy_deals), self.MIN_DISCOUNT_PERCENT, self.MIN_RATING, self.MIN_REVIEWS)
         
         # If no catchy deals but we have some deals, relax filters and use best available
         if len(catchy_deals) == 0 and len(unique_deals) > 0:
-            logger.warning(f"⚠️ No deals met strict quality criteria. Relaxing filters to use best available deals.")
+            logger.warning("⚠️ No deals met strict quality criteria. Relaxing filters to use best available deals.")
             # Use relaxed criteria: any discount, 3.5+ rating, 10+ reviews
             relaxed_deals = []
-            for deal in unique_deals:
-                discount_pct = self._extract_discount_percentage(deal.discount)
-                rating = deal.rating or 0.0
-                reviews = deal.review_count or 0
+            for entry in deal_stats:
+                _, discount_pct, rating, reviews = entry
                 
                 if (discount_pct >= 10 and rating >= 3.5 and reviews >= 10) or (rating >= 4.0 and reviews >= 20):
-                    relaxed_deals.append(deal)
+                    relaxed_deals.append(entry)
             
             if relaxed_deals:
-                logger.info(f"Found {len(relaxed_deals)} deals with relaxed criteria")
+                logger.info("Found %s deals with relaxed criteria", len(relaxed_deals))
                 catchy_deals = relaxed_deals
             else:
                 # Last resort: use any deals with at least some rating
                 logger.warning("Using any deals with rating > 0 as last resort")
-                catchy_deals = [d for d in unique_deals if d.rating > 0 or d.review_count > 0]
+                catchy_deals = [entry for entry in deal_stats if entry[2] > 0 or entry[3] > 0]
         
         if len(catchy_deals) == 0:
             logger.warning("No deals found even with relaxed criteria. Returning empty list.")
             return []
         
-        # Score and sort deals by quality
-        scored_deals = [(deal, self._score_deal(deal)) for deal in catchy_deals]
-        scored_deals.sort(key=lambda x: x[1], reverse=True)  # Sort by score descending
-        
-        # Return top deals
-        top_deals = [deal for deal, score in scored_deals[:self.max_deals_per_source * len(self.amazon_sources)]]
+        # Return top deals by quality score; nlargest keeps sorted(..., reverse=True) order for ties
+        now = datetime.now()
+        top_scored = heapq.nlargest(
+            self.max_total_deals,
+            ((deal, self._score_deal(deal, discount_pct, now)) for deal, discount_pct, _, _ in catchy_deals),
+            key=lambda x: x[1]
+        )
+        top_deals = [deal for deal, _ in top_scored]
         
-        logger.info(f"Returning {len(top_deals)} top-scored deals")
+        logger.info("Returning %s top-scored deals", len(top_deals))
         return top_deals
     
     async def search_products_by_keyword(
@@ -167,7 +612,7 @@ class DealScraper:
         if affiliate_id:
             search_url += f"&tag={affiliate_id}"
         
-        logger.info(f"Searching Amazon for: {keyword}")
+        logger.info("Searching Amazon for: %s", keyword)
         
         try:
             deals = await self._scrape_source(search_url)
@@ -179,11 +624,11 @@ class DealScraper:
                     deal.review_count >= min_reviews):
                     filtered_deals.append(deal)
             
-            logger.info(f"Found {len(filtered_deals)} quality products for '{keyword}'")
+            logger.info("Found %s quality products for '%s'", len(filtered_deals), keyword)
             return filtered_deals
             
         except Exception as e:
-            logger.error(f"Error searching for '{keyword}': {e}")
+            logger.error("Error searching for '%s': %s", keyword, e)
             return []
     
     async def get_deal_of_the_day(self, affiliate_id: str = None) -> Optional[Product]:
@@ -191,10 +636,10 @@ class DealScraper:
         if not self.session:
             await self.initialize()
         
-        deal_of_day_urls = [
+        deal_of_day_urls = _dedupe_sources([
             "https://www.amazon.com/gp/goldbox/ref=nav_cs_gb_azl",  # Lightning Deals
             "https://www.amazon.com/gp/goldbox",  # Goldbox
-        ]
+        ])
         
         for url in deal_of_day_urls:
             try:
@@ -203,23 +648,23 @@ class DealScraper:
                     separator = '&' if '?' in url else '?'
                     url = f"{url}{separator}tag={affiliate_id}"
                 
-                logger.info(f"Fetching Deal of the Day from: {url}")
+                logger.info("Fetching Deal of the Day from: %s", url)
                 deals = await self._scrape_source(url)
                 
                 if deals:
                     # Get the first deal (usually the featured one)
                     deal = deals[0]
-                    logger.info(f"Deal of the Day found: {deal.title[:50]}...")
+                    logger.info("Deal of the Day found: %s...", deal.title[:50])
                     return deal
                     
             except Exception as e:
-                logger.warning(f"Failed to get Deal of the Day from {url}: {e}")
+                logger.warning("Failed to get Deal of the Day from %s: %s", url, e)
                 continue
         
         logger.warning("No Deal of the Day found")
         return None
     
-    async def _scrape_source(self, url: str) -> List[Product]:
+    async def _scrape_source(self, url: str, seen_asins: Optional[set] = None) -> List[Product]:
         """Scrape deals from a specific Amazon source with improved error handling and rate limiting."""
         if not self.session:
             logger.error("Session not initialized")
@@ -230,119 +675,145 @@ class DealScraper:
         
         for attempt in range(max_retries):
             try:
-                async with self.session.get(url) as response:
-                    if response.status == 429:
-                        retry_delay = min(retry_delay * 2, 60)  # Exponential backoff, max 60s
-                        logger.warning(f"Rate limited by {url}, waiting {retry_delay}s (attempt {attempt + 1}/{max_retries})")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay)
-                            continue
-                        return []
-                    elif response.status != 200:
-                        logger.warning(f"HTTP {response.status} for {url}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay)
-                            continue
-                        return []
+                async with self._source_semaphore:
+                    # Small jitter keeps concurrent requests to the same host from arriving in lockstep
+                    await asyncio.sleep(random.uniform(0.2, 1.0))
+                    async with self.session.get(url) as response:
+                        if response.status == 429:
+                            retry_delay = min(retry_delay * 2, 60)  # Exponential backoff, max 60s
+                            logger.warning("Rate limited by %s, waiting %ss (attempt %s/%s)", url, retry_delay, attempt + 1, max_retries)
+                            if attempt < max_retries - 1:
+                                await asyncio.sleep(retry_delay)
+                                continue
+                            return []
+                        elif response.status != 200:
+                            logger.warning("HTTP %s for %s", response.status, url)
+                            if attempt < max_retries - 1:
+                                await asyncio.sleep(retry_delay)
+                                continue
+                            return []
                     
-                    html = await response.text()
-                    
-                    # Check if we got a valid HTML response
-                    if len(html) < 1000:
-                        logger.warning(f"Received very short response ({len(html)} bytes) from {url}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay)
-                            continue
-                        return []
+                        # Raw bytes go straight to the parser; no Python-level decode of the whole page
+                        body, truncated = await _read_capped(response, _MAX_PAGE_BYTES)
+                        charset = response.charset
+                        if truncated:
+                            logger.warning("Response from %s exceeded %s bytes; parsing the first part only", url, _MAX_PAGE_BYTES)
                     
-                    # Check for Amazon error pages
-                    if 'captcha' in html.lower() or 'robot' in html.lower() or 'access denied' in html.lower():
-                        logger.warning(f"Amazon blocking detected (captcha/robot) for {url}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay * 2)
-                            continue
-                        return []
+                        # Check if we got a valid HTML response
+                        if len(body) < 1000:
+                            logger.warning("Received very short response (%s bytes) from %s", len(body), url)
+                            if attempt < max_retries - 1:
+                                await asyncio.sleep(retry_delay)
+                                continue
+                            return []
                     
-                    soup = BeautifulSoup(html, 'html.parser')
+                        # Check for Amazon error pages
+                        if _BLOCKED_PAGE_RE.search(body):
+                            logger.warning("Amazon blocking detected (captcha/robot) for %s", url)
+                            if attempt < max_retries - 1:
+                                await asyncio.sleep(retry_delay * 2)
+                                continue
+                            return []
                     
-                    deals = self._parse_amazon_deals(soup, url)
-                    logger.info(f"Extracted {len(deals)} deals from {url}")
-                    return deals
+                        break
                     
             except asyncio.TimeoutError:
-                logger.warning(f"Timeout scraping {url} (attempt {attempt + 1}/{max_retries})")
+                logger.warning("Timeout scraping %s (attempt %s/%s)", url, attempt + 1, max_retries)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(retry_delay)
                     continue
                 return []
             except Exception as e:
-                logger.error(f"Error scraping {url}: {e}")
+                logger.error("Error scraping %s: %s", url, e)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(retry_delay)
                     continue
                 return []
+        else:
+            return []
         
-        return []
+        # Parse off the event loop, after the connection and semaphore slot are released,
+        # so concurrent sources keep fetching while this page is parsed
+        try:
+            return await asyncio.to_thread(self._parse_page, body, charset, url, seen_asins)
+        except Exception as e:
+            logger.error("Error parsing %s: %s", url, e)
+            return []
+    
+    def _parse_page(
+        self, body: bytes, charset: Optional[str], source_url: str, seen_asins: Optional[set] = None
+    ) -> List[Product]:
+        """Parse a fetched page into products; runs in a worker thread and only touches seen_asins."""
+        soup = _make_soup(body, parse_only=_DEAL_STRAINER, from_encoding=charset)
+        try:
+            return self._parse_amazon_deals(soup, source_url, seen_asins)
+        finally:
+            # Products hold plain strings only; unlinking the tree frees it now instead of leaving
+            # thousands of parent/child cycles for the cyclic GC
+            soup.decompose()
     
-    def _parse_amazon_deals(self, soup: BeautifulSoup, source_url: str) -> List[Product]:
-        """Parse Amazon deal structures from HTML with improved selectors for deal pages."""
+    def _parse_amazon_deals(
+        self, soup: BeautifulSoup, source_url: str, seen_asins: Optional[set] = None
+    ) -> List[Product]:
+        """Parse Amazon deal structures from HTML with improved selectors for deal pages.
+
+        Elements whose data-asin is already in seen_asins are skipped before extraction;
+        ASINs of newly extracted products are added to it.
+        """
         deals = []
+        duplicates = 0
         
-        # Prioritize deal-specific selectors first - expanded list for better coverage
-        deal_selectors = [
-            '[data-component-type="s-deals-result"]',  # Deal-specific results
-            '[data-component-type="s-search-result"]',  # Search results
-            '.s-result-item[data-asin]',  # Results with ASIN
-            '[data-asin]',  # Any element with ASIN
-            '.s-result-item',  # Generic result items
-            '.DealCard',  # Deal cards
-            '.dealContainer',  # Deal containers
-            '.s-main-slot .s-result-item',  # Main slot results
-            '.s-result-list .s-result-item',  # Result list items
-            'div[data-asin]',  # Divs with ASIN
-            '.s-card-container',  # Card containers
-            '.s-card-border',  # Card borders
-        ]
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         total_elements_found = 0
-        for selector in deal_selectors:
+        for selector in self.DEAL_CONTAINER_SELECTORS:
             try:
-                elements = soup.select(selector)
+                elements = _select_all(soup, selector)
                 if elements:
                     total_elements_found += len(elements)
-                    logger.info(f"Found {len(elements)} elements with selector: {selector}")
+                    if debug:
+                        logger.debug("Found %d elements with selector: %s", len(elements), selector)
                     
                     for element in elements[:self.max_deals_per_source * 2]:  # Process more elements
+                        if seen_asins is not None and element.get('data-asin') in seen_asins:
+                            duplicates += 1
+                            continue
                         try:
                             product = self._extract_product_data(element, source_url)
                             if product and product.asin:
                                 deals.append(product)
-                                logger.debug(f"Successfully extracted product: {product.title[:50]}...")
+                                if seen_asins is not None:
+                                    seen_asins.add(product.asin)
+                                if debug:
+                                    logger.debug("Successfully extracted product: %s...", product.title[:50])
                                 
                         except Exception as e:
-                            logger.debug(f"Failed to extract product from element: {e}")
+                            if debug:
+                                logger.debug("Failed to extract product from element: %s", e)
                             continue
                     
                     # If we found deals with this selector, prioritize it
-                    if deals:
-                        logger.info(f"Successfully extracted {len(deals)} deals using selector: {selector}")
+                    if deals or duplicates:
+                        logger.info("Extracted %s deals from %s using selector %s (%s matched, %s already seen)",
+                                    len(deals), source_url, selector, len(elements), duplicates)
                         break
             except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
+                if debug:
+                    logger.debug("Selector %s failed: %s", selector, e)
                 continue
         
         if total_elements_found == 0:
-            logger.warning(f"No elements found with any selector for URL: {source_url}")
+            logger.warning("No elements found with any selector for URL: %s", source_url)
             # Try to find any ASINs in the page as last resort
             try:
                 all_asins = soup.find_all(attrs={'data-asin': True})
                 if all_asins:
-                    logger.info(f"Found {len(all_asins)} elements with data-asin attribute, but couldn't parse them")
+                    logger.info("Found %s elements with data-asin attribute, but couldn't parse them", len(all_asins))
             except Exception as e:
-                logger.debug(f"Failed to find ASINs: {e}")
+                logger.debug("Failed to find ASINs: %s", e)
         
-        if not deals:
-            logger.warning(f"No deals extracted from {source_url}. Total elements found: {total_elements_found}")
+        if not deals and not duplicates:
+            logger.warning("No deals extracted from %s. Total elements found: %s", source_url, total_elements_found)
         
         return deals
     
@@ -352,42 +823,17 @@ class DealScraper:
             # Try multiple ways to get ASIN
             asin = element.get('data-asin')
             if not asin:
-                # Try to find ASIN in href attributes
-                links = element.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '')
-                    asin_match = re.search(r'/dp/([A-Z0-9]{10})', href)
-                    if asin_match:
-                        asin = asin_match.group(1)
-                        break
-                    asin_match = re.search(r'/gp/product/([A-Z0-9]{10})', href)
+                # Scan every link's href; cards often list ads and variant links before the product one
+                for link in element.find_all('a', href=True):
+                    asin_match = _ASIN_RE.search(link['href'])
                     if asin_match:
                         asin = asin_match.group(1)
                         break
             
-            if not asin:
-                # Last resort: search in entire element text
-                asin_match = re.search(r'/dp/([A-Z0-9]{10})', str(element))
-                if asin_match:
-                    asin = asin_match.group(1)
-            
             if not asin or len(asin) != 10:
                 return None
             
-            title_selectors = [
-                'h2 a span.a-text-normal',
-                'h3 a span',
-                'h2 a span',
-                '[data-cy="title-recipe-collection"]',
-                '.s-size-mini span',
-                '.a-link-normal span',
-                '.a-text-normal',
-                'span.a-text-normal',
-                'a.a-link-normal span',
-                'h2 span',
-                'h3 span',
-            ]
-            title = self._extract_text_by_selectors(element, title_selectors)
+            title = self._extract_text_by_selectors(element, self.TITLE_SELECTORS)
             
             if not title or len(title.strip()) < 5:
                 # Try to get from link text
@@ -398,60 +844,27 @@ class DealScraper:
             if not title or len(title.strip()) < 5:
                 return None
             
-            price_selectors = [
-                '.a-price-whole',
-                '.a-price .a-offscreen',
-                '.a-offscreen',
-                '.a-price',
-                '[data-a-color="price"]',
-                '.a-price-symbol',
-                '.a-price-fraction',
-                'span.a-price',
-                '.s-price-instructions-style',
-            ]
-            price = self._extract_text_by_selectors(element, price_selectors)
+            price = self._extract_text_by_selectors(element, self.PRICE_SELECTORS)
             
             # If price not found, try to extract from price span
             if not price:
-                price_span = element.find('span', class_=re.compile(r'price|Price'))
+                price_span = element.find('span', class_=_PRICE_CLASS_RE)
                 if price_span:
                     price = price_span.get_text(strip=True)
             
-            # Improved discount extraction with more selectors
-            discount_selectors = [
-                '.savingsPercentage',
-                '.a-badge-text',
-                '[data-a-badge-color="sx-lightning-deal-red"]',
-                '.a-size-base.a-color-price',  # Price savings
-                '.a-color-price',  # Price color indicators
-                '[aria-label*="%"]',  # Any element with percentage
-            ]
-            discount = self._extract_text_by_selectors(element, discount_selectors)
+            discount = self._extract_text_by_selectors(element, self.DISCOUNT_SELECTORS)
             
             # Also check for deal badges
-            deal_badge_selectors = [
-                '[data-a-badge-color="sx-lightning-deal-red"]',
-                '.a-badge-text:contains("Lightning")',
-                '.a-badge-text:contains("Deal")',
-                '.a-badge-text:contains("Limited")',
-            ]
-            deal_badge = self._extract_text_by_selectors(element, deal_badge_selectors)
+            deal_badge = self._extract_text_by_selectors(element, self.DEAL_BADGE_SELECTORS)
             if deal_badge and not discount:
                 discount = deal_badge
             
-            rating_selectors = [
-                '.a-icon-alt',
-                '[aria-label*="stars"]',
-                '[aria-label*="out of"]',
-                '.a-icon-star',
-                'span[aria-label]',
-            ]
-            rating_text = self._extract_text_by_selectors(element, rating_selectors)
+            rating_text = self._extract_text_by_selectors(element, self.RATING_SELECTORS)
             rating = self._extract_rating(rating_text) if rating_text else 0.0
             
             # Also try to extract from star elements
             if rating == 0.0:
-                star_elements = element.find_all(class_=re.compile(r'star|rating|Rating'))
+                star_elements = element.find_all(class_=_RATING_CLASS_RE)
                 for star_elem in star_elements:
                     aria_label = star_elem.get('aria-label', '')
                     if aria_label:
@@ -459,18 +872,12 @@ class DealScraper:
                         if rating > 0:
                             break
             
-            review_selectors = [
-                '.a-size-base',
-                'a[href*="#customerReviews"]',
-                '.a-link-normal',
-                'span.a-size-base',
-            ]
-            review_text = self._extract_text_by_selectors(element, review_selectors)
+            review_text = self._extract_text_by_selectors(element, self.REVIEW_SELECTORS)
             review_count = self._extract_review_count(review_text) if review_text else 0
             
             # Try to find review count in links
             if review_count == 0:
-                review_links = element.find_all('a', href=re.compile(r'reviews|ratings'))
+                review_links = element.find_all('a', href=_REVIEW_HREF_RE)
                 for link in review_links:
                     link_text = link.get_text(strip=True)
                     review_count = self._extract_review_count(link_text)
@@ -478,25 +885,15 @@ class DealScraper:
                         break
             
             # Extract product image
-            image_selectors = [
-                'img[data-image-latency]',
-                '.s-image',
-                'img.a-dynamic-image',
-                '[data-image-index="0"] img',
-                'img.s-image',
-                '.s-product-image-container img',
-                'img[data-a-dynamic-image]',
-                '.a-dynamic-image',
-                'img[src*="images-amazon"]'
-            ]
-            image_url = self._extract_image_url(element, image_selectors)
+            image_url = self._extract_image_url(element, self.IMAGE_SELECTORS)
             
             amazon_link = f"https://www.amazon.com/dp/{asin}"
             
-            category = self._determine_category(title, element)
+            title = title.strip()
+            category = self._determine_category(title.lower())
             
             product = Product(
-                title=title.strip(),
+                title=title,
                 price=self._clean_price(price) if price else "Price not available",
                 discount=self._clean_discount(discount) if discount else "",
                 link=amazon_link,
@@ -511,25 +908,35 @@ class DealScraper:
             return product
             
         except Exception as e:
-            logger.debug(f"Error extracting product data: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Error extracting product data: %s", e)
             return None
     
-    def _extract_text_by_selectors(self, element, selectors: List[str]) -> Optional[str]:
+    def _extract_text_by_selectors(self, element, selectors: Tuple[str, ...]) -> Optional[str]:
         """Extract text using multiple CSS selectors."""
         for selector in selectors:
             try:
-                found = element.select_one(selector)
+                found = _select_first(element, selector)
                 if found and found.get_text(strip=True):
                     return found.get_text(strip=True)
             except:
                 continue
         return None
     
-    def _extract_image_url(self, element, selectors: List[str]) -> str:
+    def _extract_text_by_xpaths(self, tree, xpaths: Tuple[etree.XPath, ...]) -> Optional[str]:
+        """Extract text from the first element matched by precompiled XPath expressions."""
+        for xpath in xpaths:
+            for found in xpath(tree):
+                text = ''.join(part.strip() for part in found.itertext())
+                if text:
+                    return text
+        return None
+    
+    def _extract_image_url(self, element, selectors: Tuple[str, ...]) -> str:
         """Extract product image URL from HTML element."""
         for selector in selectors:
             try:
-                img_element = element.select_one(selector)
+                img_element = _select_first(element, selector)
                 if img_element:
                     # Try src attribute first
                     image_url = img_element.get('src') or img_element.get('data-src')
@@ -537,212 +944,108 @@ class DealScraper:
                         # Clean up Amazon image URL (remove size parameters for full resolution)
                         if 'images-na.ssl-images-amazon.com' in image_url or 'images-amazon.com' in image_url:
                             # Remove size parameters to get full resolution
-                            image_url = re.sub(r'\._[A-Z0-9,]+_\.', '.', image_url)
+                            image_url = _IMAGE_SIZE_RE.sub('.', image_url)
                             return image_url
             except Exception as e:
-                logger.debug(f"Failed to extract image with selector {selector}: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Failed to extract image with selector %s: %s", selector, e)
                 continue
         
         # If no image found with selectors, try to get from data attributes
         try:
-            img_elem = element.select_one('img[data-a-dynamic-image]')
+            img_elem = _select_first(element, 'img[data-a-dynamic-image]')
             if img_elem:
-                import json
                 try:
                     dynamic_images = img_elem.get('data-a-dynamic-image', '{}')
                     if dynamic_images:
-                        dynamic_images_dict = json.loads(dynamic_images)
+                        dynamic_images_dict = _json.loads(dynamic_images)
                         if dynamic_images_dict:
                             # Get the first (usually largest) image
-                            image_url = list(dynamic_images_dict.keys())[0]
+                            image_url = next(iter(dynamic_images_dict))
                             # Clean up the URL
-                            image_url = re.sub(r'\._[A-Z0-9,]+_\.', '.', image_url)
+                            image_url = _IMAGE_SIZE_RE.sub('.', image_url)
                             return image_url
-                except (json.JSONDecodeError, KeyError, IndexError):
+                except (ValueError, TypeError):
                     pass
         except Exception as e:
-            logger.debug(f"Failed to extract image from data attributes: {e}")
+            logger.debug("Failed to extract image from data attributes: %s", e)
         
         return ""
     
     def _clean_price(self, price_text: str) -> str:
         """Clean and format price text."""
-        if not price_text:
-            return "Price not available"
-        price_match = re.search(r'[\d,]+\.?\d*', price_text.replace(',', ''))
-        if price_match:
-            return f"${price_match.group()}"
-        return price_text[:50]
+        return _clean_price_text(price_text)
     
     def _clean_discount(self, discount_text: str) -> str:
-        if not discount_text:
-            return ""
-        percent_match = re.search(r'(\d+)%', discount_text)
-        if percent_match:
-            return f"{percent_match.group(1)}% off"
-        return discount_text[:20]
+        return _clean_discount_text(discount_text)
     
     def _extract_rating(self, rating_text: str) -> float:
         """Extract rating from text."""
-        if not rating_text:
-            return 0.0
-        
-        # Try multiple patterns
-        patterns = [
-            r'(\d+\.?\d*)\s*out of',  # "4.5 out of 5"
-            r'(\d+\.?\d*)\s*stars?',  # "4.5 stars"
-            r'(\d+\.?\d*)\s*\/\s*5',  # "4.5/5"
-            r'rating[:\s]+(\d+\.?\d*)',  # "rating: 4.5"
-            r'(\d+\.?\d*)',  # Just a number
-        ]
-        
-        for pattern in patterns:
-            rating_match = re.search(pattern, rating_text.lower())
-            if rating_match:
-                try:
-                    rating = float(rating_match.group(1))
-                    # Validate rating is between 0 and 5
-                    if 0 <= rating <= 5:
-                        return rating
-                except:
-                    continue
-        
-        return 0.0
+        return _parse_rating(rating_text)
     
     def _extract_review_count(self, review_text: str) -> int:
         """Extract review count from text."""
-        if not review_text:
-            return 0
-        
-        # Handle formats like "1,234", "1.2k", "1.5K", etc.
-        review_text_clean = review_text.replace(',', '').strip()
-        
-        # Check for "k" or "K" suffix (thousands)
-        k_match = re.search(r'([\d.]+)\s*[kK]', review_text_clean)
-        if k_match:
-            try:
-                return int(float(k_match.group(1)) * 1000)
-            except:
-                pass
-        
-        # Regular number match
-        number_match = re.search(r'([\d,]+)', review_text_clean)
-        if number_match:
-            try:
-                return int(number_match.group(1).replace(',', ''))
-            except:
-                pass
-        
-        return 0
+        return _parse_review_count(review_text)
     
     def _extract_discount_percentage(self, discount_text: str) -> float:
         """Extract discount percentage as a float."""
-        if not discount_text:
-            return 0.0
-        
-        # Look for percentage patterns: "20%", "20% off", "Save 20%", etc.
-        percent_match = re.search(r'(\d+)\s*%', discount_text)
-        if percent_match:
-            try:
-                return float(percent_match.group(1))
-            except:
-                pass
-        
-        return 0.0
+        return _parse_discount_percentage(discount_text)
     
-    def _filter_catchy_deals(self, deals: List[Product]) -> List[Product]:
-        """Filter deals to only include catchy ones meeting quality thresholds."""
+    def _filter_catchy_deals(
+        self, deal_stats: List[Tuple[Product, float, float, int]]
+    ) -> List[Tuple[Product, float, float, int]]:
+        """Filter (deal, discount %, rating, reviews) entries to catchy ones meeting quality thresholds."""
         catchy_deals = []
         
-        for deal in deals:
-            discount_pct = self._extract_discount_percentage(deal.discount)
-            rating = deal.rating or 0.0
-            reviews = deal.review_count or 0
+        for entry in deal_stats:
+            deal, discount_pct, rating, reviews = entry
             
             # Check if deal meets minimum thresholds
             if (discount_pct >= self.MIN_DISCOUNT_PERCENT and 
                 rating >= self.MIN_RATING and 
                 reviews >= self.MIN_REVIEWS):
-                catchy_deals.append(deal)
+                catchy_deals.append(entry)
             else:
-                logger.debug(f"Deal filtered out: {deal.title[:30]}... (discount: {discount_pct}%, rating: {rating}, reviews: {reviews})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Deal filtered out: %s... (discount: %s%%, rating: %s, reviews: %s)",
+                                 deal.title[:30], discount_pct, rating, reviews)
         
         return catchy_deals
     
-    def _score_deal(self, deal: Product) -> float:
+    def _score_deal(
+        self, deal: Product, discount_pct: Optional[float] = None, now: Optional[datetime] = None
+    ) -> float:
         """Calculate a quality score for a deal. Higher is better."""
-        score = 0.0
-        
         # Discount percentage (0-50 points, higher discount = higher score)
-        discount_pct = self._extract_discount_percentage(deal.discount)
-        score += min(discount_pct * 2, 50)  # Max 50 points for discount
-        
-        # Rating (0-30 points, 4.0+ gets full points)
-        rating = deal.rating or 0.0
-        if rating >= 4.5:
-            score += 30
-        elif rating >= 4.0:
-            score += 20
-        elif rating >= 3.5:
-            score += 10
+        if discount_pct is None:
+            discount_pct = self._extract_discount_percentage(deal.discount)
+        score = min(discount_pct * 2, 50)  # Max 50 points for discount
+        
+        # Rating (0-30 points, 4.5+ gets full points)
+        score += _RATING_POINTS[bisect_right(_RATING_THRESHOLDS, deal.rating or 0.0)]
         
         # Review count (0-20 points, more reviews = more trustworthy)
-        reviews = deal.review_count or 0
-        if reviews >= 1000:
-            score += 20
-        elif reviews >= 500:
-            score += 15
-        elif reviews >= 100:
-            score += 10
-        elif reviews >= 50:
-            score += 5
+        score += _REVIEW_POINTS[bisect_right(_REVIEW_THRESHOLDS, deal.review_count or 0)]
         
         # Deal freshness bonus (0-10 points, newer deals prioritized)
-        if deal.asin in self.deal_timestamps:
-            time_since_seen = datetime.now() - self.deal_timestamps[deal.asin]
-            if time_since_seen < timedelta(hours=1):
-                score += 10
-            elif time_since_seen < timedelta(hours=6):
-                score += 7
-            elif time_since_seen < timedelta(hours=24):
-                score += 5
+        first_seen = self.deal_timestamps.get(deal.asin)
+        if first_seen is not None:
+            time_since_seen = (now or datetime.now()) - first_seen
+            score += _FRESHNESS_POINTS[bisect_right(_FRESHNESS_LIMITS, time_since_seen)]
         
         # Deal badge bonus (Lightning Deal, Limited Time, etc.)
-        if deal.discount:
-            discount_lower = deal.discount.lower()
-            if 'lightning' in discount_lower or 'limited' in discount_lower:
-                score += 5
-        
-        return score
-    
-    def _determine_category(self, title: str, element) -> str:
-        """Determine product category from title and element."""
-        title_lower = title.lower()
-        
-        category_map = {
-            'electronics': ['phone', 'tablet', 'laptop', 'speaker', 'headphone', 'camera', 'tv', 'smart', 'wireless'],
-            'home': ['kitchen', 'cooking', 'chair', 'table', 'lamp', 'bed', 'pillow', 'blanket'],
-            'fashion': ['shirt', 'pants', 'dress', 'shoes', 'jacket', 'jeans', 'clothing'],
-            'sports': ['fitness', 'exercise', 'gym', 'workout', 'sports', 'running', 'yoga'],
-            'beauty': ['beauty', 'skincare', 'makeup', 'hair', 'cosmetic', 'shampoo'],
-            'books': ['book', 'kindle', 'novel', 'textbook', 'magazine']
-        }
-        
-        for category, keywords in category_map.items():
-            if any(keyword in title_lower for keyword in keywords):
-                return category
+        if deal.discount and _DEAL_BADGE_RE.search(deal.discount):
+            score += 5
         
-        return 'general'
+        return float(score)
+    
+    def _determine_category(self, title_lower: str) -> str:
+        """Determine product category from the already-lowercased product title."""
+        return _categorize(title_lower)
     
     def _extract_description(self, element) -> str:
         """Extract product description or features."""
-        desc_selectors = [
-            '.a-size-base-plus',
-            '.s-color-secondary',
-            '[data-cy="secondary-recipe-collection"]'
-        ]
-        
-        description = self._extract_text_by_selectors(element, desc_selectors)
+        description = self._extract_text_by_selectors(element, self.DESCRIPTION_SELECTORS)
         if description:
             return description[:200]
         
@@ -755,10 +1058,10 @@ class DealScraper:
         try:
             real_deals = await self.scrape_real_amazon_deals()
             if real_deals:
-                logger.info(f"Found {len(real_deals)} real deals")
+                logger.info("Found %s real deals", len(real_deals))
                 return real_deals
         except Exception as e:
-            logger.error(f"Real scraping failed: {e}")
+            logger.error("Real scraping failed: %s", e)
         
         logger.warning("No real deals available from scraping")
         return []
@@ -779,49 +1082,56 @@ class DealScraper:
         
         # Sanitize URL - remove any potential script injections
         url = url.strip()
-        if not (url.startswith('http://') or url.startswith('https://')):
-            logger.warning(f"Invalid URL format (must start with http:// or https://): {url[:50]}...")
+        if not url.startswith(_VALID_SCHEMES):
+            logger.warning("Invalid URL format (must start with http:// or https://): %s...", url[:50])
             return None
         
         # Validate it's an Amazon URL
-        amazon_domains = ['amazon.com', 'amazon.co.uk', 'amazon.de', 'amazon.fr', 
-                         'amazon.ca', 'amazon.com.au', 'amazon.co.jp', 'amazon.in']
-        if not any(domain in url.lower() for domain in amazon_domains):
-            logger.warning(f"URL is not from Amazon: {url[:50]}...")
+        try:
+            host = urlsplit(url).hostname or ''
+        except ValueError:
+            host = ''
+        if not (host in _AMAZON_HOSTS or host.endswith(_AMAZON_HOST_SUFFIXES)):
+            logger.warning("URL is not from Amazon: %s...", url[:50])
             return None
         
         # Additional security: check for suspicious patterns
-        suspicious_patterns = ['javascript:', 'data:', 'vbscript:', '<script']
-        if any(pattern in url.lower() for pattern in suspicious_patterns):
-            logger.warning(f"Suspicious URL pattern detected: {url[:50]}...")
+        if _SUSPICIOUS_RE.search(url.lower()):
+            logger.warning("Suspicious URL pattern detected: %s...", url[:50])
             return None
         
+        cached = self._product_cache.get(url)
+        if cached is not None:
+            return replace(cached)
+        
+        # Concurrent scrapes of the same URL share one request; every caller gets its own copy
+        product = await self._single_flight.run(url, lambda: self._scrape_and_cache(url))
+        return replace(product) if product else None
+    
+    async def _scrape_and_cache(self, url: str) -> Optional[Product]:
+        """Scrape url and remember the product; failed scrapes (non-200, missing title, errors) are retried next call."""
+        product = await self._scrape_specific_deal_uncached(url)
+        if product is not None:
+            self._product_cache.set(url, product)
+        return product
+    
+    async def _scrape_specific_deal_uncached(self, url: str) -> Optional[Product]:
+        """Fetch and parse a validated product URL."""
         try:
-            logger.info(f"Scraping specific deal from: {url}")
+            logger.info("Scraping specific deal from: %s", url)
             
             async with self.session.get(url) as response:
                 if response.status != 200:
-                    logger.warning(f"HTTP {response.status} for {url}")
+                    logger.warning("HTTP %s for %s", response.status, url)
                     return None
                 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                tree = await _parse_product_stream(response, _MAX_PAGE_BYTES)
                 
-                title = self._extract_text_by_selectors(soup, [
-                    '.product-title',
-                    'h1.a-size-large'
-                ])
+                title = self._extract_text_by_xpaths(tree, _PRODUCT_TITLE_XPATHS)
                 
-                price = self._extract_text_by_selectors(soup, [
-                    '.a-price-whole',
-                    '.a-price .a-offscreen',
-                    '.price .a-price-whole'
-                ])
+                price = self._extract_text_by_xpaths(tree, _PRODUCT_PRICE_XPATHS)
                 
-                discount = self._extract_text_by_selectors(soup, [
-                    '.savingsPercentage',
-                    '.a-badge-text'
-                ])
+                discount = self._extract_text_by_xpaths(tree, _PRODUCT_DISCOUNT_XPATHS)
                 
                 if not title:
                     logger.warning("Could not extract product title")
@@ -834,18 +1144,35 @@ class DealScraper:
                     price=self._clean_price(price) if price else "Price not available",
                     discount=self._clean_discount(discount) if discount else "",
                     link=url,
-                    category=self._determine_category(title, soup),
+                    category=self._determine_category(title.lower()),
                     asin=asin,
                     description=""
                 )
                 
-                logger.info(f"Successfully scraped product: {title[:50]}...")
+                logger.info("Successfully scraped product: %s...", title[:50])
                 return product
                 
         except Exception as e:
-            logger.error(f"Error scraping specific deal: {e}")
+            logger.error("Error scraping specific deal: %s", e)
             return None
     
+    async def scrape_specific_deals(self, urls: List[str], concurrency: int = 16) -> List[Optional[Product]]:
+        """Scrape several product URLs concurrently; results line up with urls, None where scraping failed."""
+        if not urls:
+            return []
+        
+        if not self.session:
+            await self.initialize()
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def scrape_one(url: str) -> Optional[Product]:
+            async with semaphore:
+                return await self.scrape_specific_deal(url)
+        
+        results = await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+        return [None if isinstance(result, BaseException) else result for result in results]
+    
     async def __aenter__(self):
         """Async context manager entry."""
         await self.initialize()
@@ -858,12 +1185,5 @@ class DealScraper:
     
     def _extract_asin(self, url: str) -> str:
         """Extract ASIN from Amazon URL."""
-        asin_match = re.search(r'/dp/([A-Z0-9]{10})', url)
-        if asin_match:
-            return asin_match.group(1)
-        
-        asin_match = re.search(r'/gp/product/([A-Z0-9]{10})', url)
-        if asin_match:
-            return asin_match.group(1)
-        
-        return ""
+        asin_match = _ASIN_RE.search(url)
+        return asin_match.group(1) if asin_match else ""
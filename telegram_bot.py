@@ -446,7 +446,7 @@ Need help? Just ask!"""
             region_text = f"""
 🌍 **Choose Your Amazon Region**
 
-Current: **{current_region}** ({currency_info['symbol']} {currency_info['code']})
+Current: **{current_region}** ({currency_info.symbol} {currency_info.code})
 
 Select your preferred Amazon marketplace to get deals with correct pricing and links:
 """.strip()
@@ -1,4 +1,4 @@
-from config import Config
+from config import Config, get_config
 
 
 def test_affiliate_link_generation_contains_tag(monkeypatch):
@@ -16,3 +16,76 @@ def test_affiliate_link_invalid_url_returns_empty(monkeypatch):
     cfg = Config()
 
     assert cfg.get_affiliate_link("not-a-url") == ""
+
+
+def test_affiliate_link_extracts_asin_from_gp_product_url(monkeypatch):
+    monkeypatch.setenv("AMAZON_AFFILIATE_ID", "one4allmarket-21")
+    cfg = Config()
+
+    link = cfg.get_affiliate_link("https://www.amazon.com/gp/product/B0C1234567?ref=x")
+
+    assert link.startswith("https://www.amazon.com/dp/B0C1234567?tag=one4allmarket-21")
+
+
+def test_affiliate_link_keeps_regional_domain(monkeypatch):
+    monkeypatch.setenv("AMAZON_AFFILIATE_ID", "one4allmarket-21")
+    cfg = Config()
+
+    link = cfg.get_affiliate_link("https://www.amazon.co.uk/Some-Product/dp/B0C1234567")
+
+    assert link.startswith("https://amazon.co.uk/dp/B0C1234567?")
+
+
+def test_get_config_returns_cached_instance():
+    get_config.cache_clear()
+    try:
+        assert get_config() is get_config()
+    finally:
+        get_config.cache_clear()
+
+
+def test_format_price_for_region_uses_regional_conventions():
+    cfg = Config()
+
+    assert cfg.format_price_for_region("$1,234.50", "US") == "$1,234.50"
+    assert cfg.format_price_for_region("12,50", "DE") == "€12.50"
+    assert cfg.format_price_for_region("1234", "JP") == "¥1,234"
+
+
+def test_admin_user_ids_skip_blank_and_non_numeric(monkeypatch):
+    monkeypatch.setenv("ADMIN_USER_IDS", " 123, abc,,456 ")
+    cfg = Config()
+
+    assert cfg.ADMIN_USER_IDS == [123, 456]
+
+
+def test_affiliate_link_with_invalid_regional_id_returns_original_url(monkeypatch):
+    monkeypatch.setenv("AMAZON_AFFILIATE_ID", "one4allmarket-21")
+    monkeypatch.setenv("AMAZON_AFFILIATE_ID_UK", "bad tag!")
+    cfg = Config()
+    url = "https://www.amazon.co.uk/dp/B0C1234567"
+
+    assert cfg.get_affiliate_link(url, region="UK") == url
+    assert "tag=one4allmarket-21" in cfg.get_affiliate_link(url, region="US")
+
+
+def test_region_info_returns_an_independent_copy(monkeypatch):
+    monkeypatch.setenv("AMAZON_AFFILIATE_ID", "one4allmarket-21")
+    cfg = Config()
+
+    info = cfg.get_region_info("US")
+    info["affiliate_id"] = "mutated-21"
+
+    assert cfg.get_region_info("US")["affiliate_id"] == "one4allmarket-21"
+
+
+def test_affiliate_link_keeps_marketplace_of_smile_and_mobile_subdomains(monkeypatch):
+    monkeypatch.setenv("AMAZON_AFFILIATE_ID", "one4allmarket-21")
+    cfg = Config()
+
+    smile = cfg.get_affiliate_link("https://smile.amazon.co.uk/dp/B0C1234567")
+    mobile = cfg.get_affiliate_link("https://m.amazon.de/Some-Product/dp/B0C1234567?ref=x")
+
+    assert smile.startswith("https://amazon.co.uk/dp/B0C1234567?")
+    assert mobile.startswith("https://amazon.de/dp/B0C1234567?")
+    assert cfg.get_affiliate_link("https://smile.amazon.com/dp/B0C1234567").startswith("https://www.amazon.com/dp/")
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+
+import pytest
+
+from link_validator import _RESULT_CACHE, _RETRY_MAX_DELAY, LinkValidator, LinkValidationResult, _backoff_delay, _cache_key
+
+
+def test_cache_key_collapses_tracking_params_and_subdomains():
+    assert _cache_key("https://www.amazon.com/dp/B0C1234567?tag=x-21") == "amazon.com/dp/B0C1234567"
+    assert _cache_key("https://smile.amazon.com/Some-Slug/dp/B0C1234567?ref=sr_1") == "amazon.com/dp/B0C1234567"
+    assert _cache_key("https://www.amazon.co.uk/gp/product/B0C1234567") == "amazon.co.uk/dp/B0C1234567"
+    assert _cache_key("https://www.amazon.com/dp/b0c1234567") == "amazon.com/dp/B0C1234567"
+
+
+def test_batch_validates_each_product_once_and_preserves_order(monkeypatch):
+    validator = LinkValidator()
+    validator.session = object()
+    calls = []
+
+    async def fake_validate(self, url):
+        calls.append(url)
+        return LinkValidationResult(url=url, is_valid=False, error_message="Request timeout")
+
+    monkeypatch.setattr(LinkValidator, "_validate_link_uncached", fake_validate)
+    urls = [
+        "https://www.amazon.com/dp/B0C1234567?tag=x-21",
+        "https://www.amazon.de/dp/B0C7654321",
+        "https://smile.amazon.com/dp/B0C1234567?ref=dup",
+    ]
+
+    results = asyncio.run(validator.validate_links_batch(urls))
+
+    assert len(calls) == 2
+    assert [r.url for r in results] == urls
+
+
+def test_batch_rejects_non_amazon_links_without_fetching(monkeypatch):
+    validator = LinkValidator()
+    validator.session = object()
+    calls = []
+
+    async def fake_validate(self, url):
+        calls.append(url)
+        return LinkValidationResult(url=url, is_valid=True, status_code=200)
+
+    monkeypatch.setattr(LinkValidator, "_validate_link_uncached", fake_validate)
+
+    results = asyncio.run(validator.validate_links_batch([
+        "not-a-url",
+        "https://example.com/dp/B0C1234567",
+        "https://www.amazon.com/dp/B0C12?tag=x-21",
+    ]))
+
+    assert calls == []
+    assert [r.error_message for r in results] == ["Invalid URL format", "Not an Amazon link", "Invalid ASIN"]
+
+
+def test_precheck_only_inspects_the_path():
+    validator = LinkValidator()
+
+    assert validator._precheck("https://www.amazon.com/gp/goldbox?redirect=/dp/x") is None
+    assert validator._precheck("https://www.amazon.com/s?k=a#/dp/") is None
+    assert validator._precheck("https://www.amazon.com/dp/b0c1234567") is None
+    assert validator._precheck("https://www.amazon.com/dp/x?k=1").error_message == "Invalid ASIN"
+
+
+def test_batch_reports_failure_when_coalesced_leader_raises(monkeypatch):
+    validator = LinkValidator()
+    validator.session = object()
+    url = "https://www.amazon.com/dp/B0C1234567"
+
+    async def failing_validate(self, url):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(LinkValidator, "_validate_link_uncached", failing_validate)
+
+    async def scenario():
+        leader = asyncio.create_task(validator.validate_link(url))
+        await asyncio.sleep(0)
+        results = await asyncio.wait_for(validator.validate_links_batch([url + "?tag=a"]), 1)
+        with pytest.raises(RuntimeError):
+            await leader
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert [r.is_valid for r in results] == [False]
+    assert results[0].error_message == "Exception: boom"
+
+
+def test_forbidden_result_is_retried_on_the_next_call(monkeypatch):
+    _RESULT_CACHE.clear()
+    validator = LinkValidator()
+    validator.session = object()
+    calls = []
+
+    async def forbidden(self, url):
+        calls.append(url)
+        return LinkValidationResult(url=url, is_valid=False, status_code=403, error_message="HTTP 403")
+
+    async def gone(self, url):
+        calls.append(url)
+        return LinkValidationResult(url=url, is_valid=False, status_code=404, error_message="HTTP 404")
+
+    monkeypatch.setattr(LinkValidator, "_validate_link_uncached", forbidden)
+    for _ in range(2):
+        asyncio.run(validator.validate_link("https://www.amazon.com/dp/B0C1234567"))
+    assert len(calls) == 2
+
+    monkeypatch.setattr(LinkValidator, "_validate_link_uncached", gone)
+    for _ in range(2):
+        asyncio.run(validator.validate_link("https://www.amazon.com/dp/B0C7654321"))
+    assert len(calls) == 3
+
+
+def _reachable(self, url):
+    async def validate():
+        return self._valid_result(url, 200, url, 0.01)
+    return validate()
+
+
+def test_tag_check_runs_on_cache_hits_from_other_validators(monkeypatch, caplog):
+    _RESULT_CACHE.clear()
+    monkeypatch.setattr(LinkValidator, "_validate_link_uncached", _reachable)
+    url = "https://www.amazon.com/dp/B0C1234567?tag=bad-21"
+    untagged, tagged = LinkValidator(), LinkValidator(expected_affiliate_tag="mine-21")
+    untagged.session = tagged.session = object()
+
+    asyncio.run(untagged.validate_link(url))
+    asyncio.run(tagged.validate_link(url))
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="link_validator"):
+        result = asyncio.run(tagged.validate_link(url))
+
+    assert result.is_valid
+    assert "Tag mismatch" in caplog.text
+
+
+def test_batch_checks_the_tag_of_every_duplicate(monkeypatch, caplog):
+    _RESULT_CACHE.clear()
+    calls = []
+
+    def reachable(self, url):
+        calls.append(url)
+        return _reachable(self, url)
+
+    monkeypatch.setattr(LinkValidator, "_validate_link_uncached", reachable)
+    validator = LinkValidator(expected_affiliate_tag="mine-21")
+    validator.session = object()
+    urls = [
+        "https://www.amazon.com/dp/B0C1234567?tag=mine-21",
+        "https://www.amazon.com/dp/B0C1234567?tag=bad-21",
+        "https://www.amazon.com/Slug/dp/B0C1234567?tag=bad-21&ref=dup",
+    ]
+
+    with caplog.at_level(logging.WARNING, logger="link_validator"):
+        results = asyncio.run(validator.validate_links_batch(urls))
+
+    assert len(calls) == 2
+    assert all(r.is_valid for r in results)
+    mismatches = [r.getMessage() for r in caplog.records if "Tag mismatch" in r.getMessage()]
+    assert len(mismatches) == 2
+
+
+def test_backoff_delay_honours_retry_after_or_gives_up():
+    assert _backoff_delay(0, "3") == 3.0
+    assert _backoff_delay(0, "-5") == 0.0
+    assert _backoff_delay(0, str(_RETRY_MAX_DELAY)) == _RETRY_MAX_DELAY
+    assert _backoff_delay(0, "120") is None
+
+    # HTTP-date and missing values fall back to capped, jittered exponential backoff
+    assert 0.5 <= _backoff_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") < 0.75
+    assert 2.0 <= _backoff_delay(2) < 2.25
+    assert _RETRY_MAX_DELAY <= _backoff_delay(10) < _RETRY_MAX_DELAY + 0.25
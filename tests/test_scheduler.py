@@ -0,0 +1,113 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import scheduler
+from scheduler import TaskScheduler
+
+
+class _FakeBot:
+    def __init__(self, clock, events, post_deals_gate=None):
+        self.clock = clock
+        self.events = events
+        self.post_deals_gate = post_deals_gate
+        self.post_calls = 0
+        self.db_manager = self
+
+    async def post_deals(self):
+        self.post_calls += 1
+        if self.post_deals_gate is not None:
+            await self.post_deals_gate.wait()
+        self.events.append((self.clock[0], "deal_posting"))
+        if self.post_calls == 1 and self.post_deals_gate is None:
+            raise RuntimeError("telegram down")
+        return 1
+
+    async def cleanup_old_deals(self, days=30):
+        self.events.append((self.clock[0], "cleanup"))
+        return 0
+
+    async def get_deal_stats(self):
+        self.events.append((self.clock[0], "stats"))
+        return None
+
+
+def _drive(monkeypatch, bot, clock, stop_when):
+    """Run _run_loop on a fake clock that jumps straight to the next deadline."""
+    # Only the scheduler's clock is faked; the event loop keeps real time
+    monkeypatch.setattr(scheduler, "time", SimpleNamespace(monotonic=lambda: clock[0], perf_counter=time.perf_counter))
+    task_scheduler = TaskScheduler(bot, SimpleNamespace(POST_INTERVAL_MINUTES=1))
+
+    async def fake_wait(self, delay):
+        # Let jobs started this round run and reschedule before looking at the heap
+        for _ in range(3):
+            await asyncio.sleep(0)
+        if stop_when():
+            self.running = False
+        elif self._schedule:
+            clock[0] = max(clock[0], self._schedule[0][0])
+
+    monkeypatch.setattr(TaskScheduler, "_wait", fake_wait)
+
+    async def run():
+        task_scheduler.running = True
+        await asyncio.wait_for(task_scheduler._run_loop(), 1)
+
+    asyncio.run(run())
+    return task_scheduler
+
+
+def test_run_loop_runs_jobs_in_deadline_order_and_reschedules(monkeypatch):
+    clock = [1000.0]
+    events = []
+    bot = _FakeBot(clock, events)
+
+    task_scheduler = _drive(monkeypatch, bot, clock, lambda: len(events) >= 6)
+
+    # deal posting fails first and is retried after 300s, then runs every POST_INTERVAL_MINUTES
+    assert events == [
+        (1060.0, "deal_posting"),
+        (1120.0, "stats"),
+        (1300.0, "cleanup"),
+        (1360.0, "deal_posting"),
+        (1420.0, "deal_posting"),
+        (1480.0, "deal_posting"),
+    ]
+    assert sorted(task_scheduler._schedule) == [
+        (1540.0, 0, "deal_posting"),
+        (1120.0 + 3600, 2, "stats"),
+        (1300.0 + 24 * 3600, 1, "cleanup"),
+    ]
+
+    posting = task_scheduler.monitor.task_metrics["deal_posting"]
+    assert (posting.executions, posting.successes, posting.failures) == (4, 3, 1)
+    assert task_scheduler.monitor.task_metrics["stats"].successes == 1
+    assert task_scheduler.monitor.task_metrics["cleanup"].successes == 1
+    assert task_scheduler.monitor.get_task_health("deal_posting")["status"] == "warning"
+
+    status = task_scheduler.get_task_status()
+    for field, remaining in (
+        ("next_deal_posting", 1540.0 - 1480.0),
+        ("next_stats_update", 1120.0 + 3600 - 1480.0),
+        ("next_cleanup", 1300.0 + 24 * 3600 - 1480.0),
+    ):
+        expected = datetime.now() + timedelta(seconds=remaining)
+        reported = datetime.strptime(status[field], "%Y-%m-%d %H:%M:%S")
+        assert abs((reported - expected).total_seconds()) < 5
+
+
+def test_slow_job_does_not_delay_other_jobs(monkeypatch):
+    clock = [0.0]
+    events = []
+    gate = asyncio.Event()
+    bot = _FakeBot(clock, events, post_deals_gate=gate)
+
+    task_scheduler = _drive(
+        monkeypatch, bot, clock, lambda: [name for _, name in events].count("stats") >= 2
+    )
+
+    assert bot.post_calls == 1
+    assert events == [(120.0, "stats"), (300.0, "cleanup"), (3720.0, "stats")]
+    # The stuck posting run is not on the heap until it finishes
+    assert [name for _, _, name in task_scheduler._schedule if name == "deal_posting"] == []
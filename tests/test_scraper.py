@@ -0,0 +1,355 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from models import Product
+from scraper import (
+    DealScraper,
+    _DEAL_STRAINER,
+    _PRODUCT_DISCOUNT_XPATHS,
+    _PRODUCT_PRICE_XPATHS,
+    _PRODUCT_TITLE_XPATHS,
+    _dedupe_sources,
+    _make_soup,
+    _parse_product_stream,
+)
+
+
+SEARCH_PAGE = """
+<html><head><script>var nav = {"ready": true};</script></head><body>
+<nav class="s-result-item"><a href="/gp/help">Help</a></nav>
+<div class="s-main-slot">
+  <div data-asin="B0C1234567" data-component-type="s-search-result" class="s-result-item">
+    <h2><a class="a-link-normal" href="/Wireless-Headphones/dp/B0C1234567"><span class="a-text-normal">Wireless Noise Cancelling Headphones</span></a></h2>
+    <span class="a-price"><span class="a-offscreen">$1,299.99</span><span class="a-price-whole">1,299.</span></span>
+    <span class="a-badge-text">Save 35%</span>
+    <span class="a-icon-alt">4.6 out of 5 stars</span>
+    <span class="a-size-base">12,345</span>
+    <img class="s-image" src="https://images-na.ssl-images-amazon.com/images/I/71abc._SL500_.jpg">
+  </div>
+  <div data-asin="B0C7654321" data-component-type="s-search-result" class="s-result-item">
+    <h2><a href="/gp/product/B0C7654321"><span>Yoga Mat with Carrying Strap</span></a></h2>
+    <span class="a-price-whole">24.</span>
+    <i class="a-icon-star" aria-label="4.2 out of 5 stars"></i>
+    <a href="/product-reviews/B0C7654321#customerReviews">1.2K ratings</a>
+  </div>
+</div>
+<footer><div class="s-result-item">Footer</div></footer>
+</body></html>
+"""
+
+
+def test_parse_amazon_deals_extracts_products_from_strained_tree():
+    scraper = DealScraper()
+    soup = _make_soup(SEARCH_PAGE, parse_only=_DEAL_STRAINER)
+
+    deals = scraper._parse_amazon_deals(soup, "https://www.amazon.com/s?k=deals")
+
+    assert [d.asin for d in deals] == ["B0C1234567", "B0C7654321"]
+    headphones, mat = deals
+    assert headphones.title == "Wireless Noise Cancelling Headphones"
+    assert headphones.link == "https://www.amazon.com/dp/B0C1234567"
+    assert headphones.price == "$1299."
+    assert headphones.discount == "35% off"
+    assert headphones.rating == 4.6
+    assert headphones.review_count == 12345
+    assert headphones.category == "electronics"
+    assert headphones.image_url == "https://images-na.ssl-images-amazon.com/images/I/71abc.jpg"
+    assert mat.title == "Yoga Mat with Carrying Strap"
+    assert mat.rating == 4.2
+    assert mat.review_count == 1200
+    assert mat.category == "sports"
+
+
+def _deal_card(asin, title):
+    return (
+        f'<div class="DealCard"><a href="/deal/dp/{asin}">{title}</a>'
+        '<span class="a-price"><span class="a-offscreen">$19.99</span></span>'
+        '<span class="savingsPercentage">-30%</span></div>'
+    )
+
+
+def test_parse_page_keeps_class_only_deal_cards_next_to_asin_placeholders():
+    page = (
+        '<html><body><div id="nav"><a href="/dp/B0NAVLINK1">Nav</a></div>'
+        '<div data-asin=""></div>'
+        + _deal_card("B0C1111111", "Stainless Steel Water Bottle")
+        + _deal_card("B0C2222222", "Bluetooth Speaker Waterproof")
+        + _deal_card("B0C3333333", "Memory Foam Bed Pillow")
+        + "</body></html>"
+    ).encode()
+
+    deals = DealScraper()._parse_page(page, "utf-8", "https://www.amazon.com/deals", set())
+
+    assert [d.asin for d in deals] == ["B0C1111111", "B0C2222222", "B0C3333333"]
+
+
+def test_parse_amazon_deals_skips_asins_already_seen():
+    scraper = DealScraper()
+    seen = {"B0C1234567"}
+
+    deals = scraper._parse_amazon_deals(_make_soup(SEARCH_PAGE), "https://www.amazon.com/deals", seen)
+
+    assert [d.asin for d in deals] == ["B0C7654321"]
+    assert seen == {"B0C1234567", "B0C7654321"}
+
+
+def test_extract_product_data_finds_asin_past_the_first_links():
+    nav = "".join(f'<a href="/stores/page/{i}">Shop {i}</a>' for i in range(6))
+    card = _make_soup(
+        f'<div class="DealCard">{nav}<a href="/Ceramic-Pan/dp/B0C1112223">Ceramic Frying Pan Set</a>'
+        '<span class="a-price"><span class="a-offscreen">$24.99</span></span></div>'
+    ).find("div")
+
+    product = DealScraper()._extract_product_data(card, "https://www.amazon.com/deals")
+
+    assert product.asin == "B0C1112223"
+    assert product.link == "https://www.amazon.com/dp/B0C1112223"
+
+
+def test_text_helpers_parse_amazon_formats():
+    scraper = DealScraper()
+
+    assert scraper._extract_rating("4.5 out of 5 stars") == 4.5
+    assert scraper._extract_rating("Rating: 3.9") == 3.9
+    assert scraper._extract_review_count("1.5K") == 1500
+    assert scraper._extract_review_count("(2,345)") == 2345
+    assert scraper._clean_price("$1,299.99") == "$1299.99"
+    assert scraper._clean_discount("Save 20%") == "20% off"
+    assert scraper._extract_discount_percentage("20 % off") == 20.0
+    assert scraper._extract_asin("https://www.amazon.com/gp/product/B0C1234567") == "B0C1234567"
+
+
+def test_determine_category_prefers_earlier_categories():
+    scraper = DealScraper()
+
+    assert scraper._determine_category("folding tablet stand") == "electronics"
+    assert scraper._determine_category("yoga book for beginners") == "sports"
+    assert scraper._determine_category("kindle paperwhite cover") == "books"
+    assert scraper._determine_category("garden hose 50ft") == "general"
+
+
+PRODUCT_PAGE = """
+<html><head><title>Amazon.com</title></head><body>
+<div id="nav-main"><span class="a-badge-text">Prime Day</span></div>
+<div id="centerCol">
+  <h1 id="title" class="a-size-large a-spacing-none">
+    <span id="productTitle" class="a-size-large product-title product-title-word-break">  Stainless Steel Kitchen Knife Set  </span>
+  </h1>
+  <div class="a-section"><span class="savingsPercentage">-42%</span>
+    <span class="a-price"><span class="a-offscreen">$57.99</span><span aria-hidden="true"><span class="a-price-whole">57<span class="a-price-decimal">.</span></span></span></span>
+  </div>
+</div>
+</body></html>
+"""
+
+
+class _FakeContent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+
+    async def iter_chunked(self, size):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+class _FakeResponse:
+    def __init__(self, body, status=200):
+        self.status = status
+        self.charset = "utf-8"
+        self.content = _FakeContent(body if isinstance(body, list) else [body.encode("utf-8")])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, body):
+        self.body = body
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return _FakeResponse(self.body)
+
+
+def test_scrape_specific_deal_extracts_title_price_and_discount():
+    scraper = DealScraper()
+    scraper.session = _FakeSession(PRODUCT_PAGE)
+
+    product = asyncio.run(scraper.scrape_specific_deal("https://www.amazon.com/Knife-Set/dp/B0C1234567?tag=x-20"))
+
+    assert product.title == "Stainless Steel Kitchen Knife Set"
+    assert product.price == "$57."
+    assert product.discount == "42% off"
+    assert product.asin == "B0C1234567"
+    assert product.category == "home"
+
+
+def test_parse_product_stream_stops_after_product_fields():
+    head, tail = PRODUCT_PAGE.split("</body>")
+    chunks = [head[:200].encode(), head[200:].encode()]
+    chunks += [b"<div class='reviews'>" + b"<p>Great knives</p>" * 500 + b"</div>"] * 5
+    chunks.append(("</body>" + tail).encode())
+    response = _FakeResponse(chunks)
+
+    tree = asyncio.run(_parse_product_stream(response, 4 * 1024 * 1024))
+
+    assert response.content.consumed == 2
+    scraper = DealScraper()
+    assert scraper._extract_text_by_xpaths(tree, _PRODUCT_TITLE_XPATHS) == "Stainless Steel Kitchen Knife Set"
+
+
+def test_parse_product_stream_waits_for_preferred_selectors():
+    first = (
+        '<html><body><h1 class="a-size-large"><span class="product-title">Chef Knife</span></h1>'
+        '<span class="a-badge-text">Amazon\'s Choice</span>'
+        '<span class="a-price"><span class="a-offscreen">$57.99</span></span>'
+    )
+    second = (
+        '<span class="savingsPercentage">-42%</span>'
+        '<span class="a-price-whole">49<span class="a-price-decimal">.</span></span>'
+        '</body></html>'
+    )
+    response = _FakeResponse([first.encode(), second.encode()])
+
+    tree = asyncio.run(_parse_product_stream(response, 4 * 1024 * 1024))
+
+    assert response.content.consumed == 2
+    scraper = DealScraper()
+    assert scraper._extract_text_by_xpaths(tree, _PRODUCT_DISCOUNT_XPATHS) == "-42%"
+    assert scraper._extract_text_by_xpaths(tree, _PRODUCT_PRICE_XPATHS) == "49."
+
+
+def test_scrape_specific_deal_rejects_non_amazon_urls_without_fetching():
+    scraper = DealScraper()
+    scraper.session = _FakeSession(PRODUCT_PAGE)
+
+    assert asyncio.run(scraper.scrape_specific_deal("https://example.com/dp/B0C1234567")) is None
+    assert asyncio.run(scraper.scrape_specific_deal("javascript:alert(1)//amazon.com")) is None
+    assert asyncio.run(scraper.scrape_specific_deal("https://example.com/amazon.com/dp/B0C1234567")) is None
+    assert asyncio.run(scraper.scrape_specific_deal("https://notamazon.com/dp/B0C1234567")) is None
+    assert scraper.session.requested == []
+
+
+def test_scrape_specific_deal_serves_repeat_urls_from_cache():
+    scraper = DealScraper()
+    scraper.session = _FakeSession(PRODUCT_PAGE)
+    url = "https://www.amazon.com/dp/B0C1234567"
+
+    async def scrape_twice():
+        first, second = await asyncio.gather(scraper.scrape_specific_deal(url), scraper.scrape_specific_deal(url))
+        third = await scraper.scrape_specific_deal(url)
+        return first, second, third
+
+    first, second, third = asyncio.run(scrape_twice())
+
+    assert first == second == third
+    assert first is not third
+    assert scraper.session.requested == [url]
+
+
+def test_scrape_specific_deal_followers_see_the_leaders_outcome(monkeypatch):
+    scraper = DealScraper()
+    scraper.session = _FakeSession(PRODUCT_PAGE)
+    url = "https://www.amazon.com/dp/B0C1234567"
+    outcomes = [RuntimeError("boom"), None]
+
+    async def scrape(self, url):
+        await asyncio.sleep(0.01)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return Product(title="Knife Set", price="$57.", discount="", link=url, category="home")
+
+    monkeypatch.setattr(DealScraper, "_scrape_specific_deal_uncached", scrape)
+
+    async def scenario():
+        failed = await asyncio.gather(
+            scraper.scrape_specific_deal(url), scraper.scrape_specific_deal(url), return_exceptions=True
+        )
+        leader = asyncio.create_task(scraper.scrape_specific_deal(url))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(scraper.scrape_specific_deal(url))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return failed, await follower
+
+    failed, product = asyncio.run(scenario())
+
+    assert [type(e) for e in failed] == [RuntimeError, RuntimeError]
+    assert product.title == "Knife Set"
+
+
+def test_scrape_specific_deals_keeps_input_order():
+    scraper = DealScraper()
+    scraper.session = _FakeSession(PRODUCT_PAGE)
+    urls = [
+        "https://www.amazon.com/dp/B0C1234567",
+        "https://example.com/dp/B0C7654321",
+        "https://www.amazon.com/gp/product/B0C7654321",
+    ]
+
+    products = asyncio.run(scraper.scrape_specific_deals(urls, concurrency=2))
+
+    assert [p.asin if p else None for p in products] == ["B0C1234567", None, "B0C7654321"]
+    assert sorted(scraper.session.requested) == sorted([urls[0], urls[2]])
+
+
+def test_dedupe_sources_collapses_ref_variants():
+    assert _dedupe_sources([
+        "https://www.amazon.com/gp/goldbox/ref=nav_cs_gb",
+        "https://www.amazon.com/gp/goldbox",
+        "https://www.amazon.com/s?k=deals&ref=sr_pg_1",
+        "https://www.amazon.com/s?k=deals",
+    ]) == ["https://www.amazon.com/gp/goldbox", "https://www.amazon.com/s?k=deals"]
+
+
+def _product(asin, discount, rating, reviews):
+    return Product(
+        title=f"Product {asin}", price="$10", discount=discount, link=f"https://www.amazon.com/dp/{asin}",
+        category="general", asin=asin, rating=rating, review_count=reviews
+    )
+
+
+def test_scrape_real_amazon_deals_dedupes_filters_and_ranks(monkeypatch):
+    pages = {
+        0: [_product("B000000001", "25% off", 4.2, 60), _product("B000000002", "50% off", 4.8, 2000)],
+        1: [_product("B000000002", "50% off", 4.8, 2000), _product("B000000003", "5% off", 4.9, 5000)],
+    }
+
+    async def fake_scrape(self, url, seen_asins=None):
+        return pages.get(self.amazon_sources.index(url), [])
+
+    monkeypatch.setattr(DealScraper, "_scrape_source", fake_scrape)
+    scraper = DealScraper(max_deals_per_source=1)
+    scraper.session = object()
+    scraper.amazon_sources = scraper.amazon_sources[:2]
+
+    deals = asyncio.run(scraper.scrape_real_amazon_deals())
+
+    assert [d.asin for d in deals] == ["B000000002", "B000000001"]
+
+
+def test_scrape_source_parses_raw_response_body(monkeypatch):
+    monkeypatch.setattr("scraper.random.uniform", lambda a, b: 0)
+
+    async def deals_page(request):
+        return web.Response(body=SEARCH_PAGE.encode("utf-8"), content_type="text/html", charset="utf-8")
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/deals", deals_page)
+        async with TestServer(app) as server:
+            async with DealScraper() as scraper:
+                return await scraper._scrape_source(str(server.make_url("/deals")))
+
+    deals = asyncio.run(run())
+
+    assert [d.asin for d in deals] == ["B0C1234567", "B0C7654321"]
@@ -4,7 +4,7 @@ import threading
 import atexit
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify
-from config import Config
+from config import Config, get_config
 from database_simple import SimpleDatabaseManager
 from core.telemetry import metrics
 
@@ -443,7 +443,7 @@ def create_app(config: Config):
 
 
 def run_production_dashboard():
-    config = Config()
+    config = get_config()
     app = create_app(config)
     
     logger.info("Starting production web dashboard on http://0.0.0.0:5000")